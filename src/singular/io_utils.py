@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Iterable, Iterator
 import json
 import os
 import tempfile
@@ -63,18 +63,40 @@ def file_lock(path: Path | str) -> Iterator[None]:
 def atomic_write_text(path: Path | str, data: str, fsync: bool = True) -> None:
     """Atomically write text to ``path`` using a temporary sibling file."""
 
+    atomic_write_bytes(path, data.encode("utf-8"), fsync)
+
+
+def atomic_write_bytes(
+    path: Path | str,
+    data: bytes,
+    fsync: bool = True,
+    *,
+    ensure_parent: bool = True,
+) -> None:
+    """Atomically write pre-encoded ``data`` to ``path`` using raw descriptors.
+
+    Writes straight to the temporary file descriptor, then replaces
+    ``path`` and fsyncs the parent directory; :func:`atomic_write_text`
+    delegates here after encoding.
+    Callers that already created the parent directory can pass
+    ``ensure_parent=False`` to skip the ``mkdir`` probe.
+    """
+
     destination = Path(path)
-    _ensure_parent(destination)
-    tmp = tempfile.NamedTemporaryFile(
-        "w", encoding="utf-8", dir=destination.parent, delete=False
-    )
+    if ensure_parent:
+        _ensure_parent(destination)
+    fd, tmp_name = tempfile.mkstemp(dir=destination.parent)
     try:
-        with tmp:
-            tmp.write(data)
-            tmp.flush()
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
             if fsync:
-                os.fsync(tmp.fileno())
-        _replace_with_retry(tmp.name, destination)
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        _replace_with_retry(tmp_name, destination)
         if fsync and not _is_windows():
             dir_fd = os.open(destination.parent, os.O_RDONLY)
             try:
@@ -83,7 +105,7 @@ def atomic_write_text(path: Path | str, data: str, fsync: bool = True) -> None:
                 os.close(dir_fd)
     finally:
         try:
-            os.unlink(tmp.name)
+            os.unlink(tmp_name)
         except FileNotFoundError:
             pass
 
@@ -150,15 +172,45 @@ def append_jsonl_line(
     path: Path | str,
     payload: dict[str, Any],
     with_lock: bool = True,
+    *,
+    encoded: str | None = None,
 ) -> None:
-    """Append one JSON object as JSONL with optional cross-platform locking."""
+    """Append one JSON object as JSONL with optional cross-platform locking.
+
+    ``encoded`` may carry the JSON text of ``payload`` when the caller already
+    serialized it, so the object is not encoded a second time.
+    """
 
     destination = Path(path)
     _ensure_parent(destination)
-    line = json.dumps(payload, ensure_ascii=False) + "\n"
+    if encoded is None:
+        encoded = json.dumps(payload, ensure_ascii=False)
+    line = encoded + "\n"
     lock_context = _locked_file(destination) if with_lock else nullcontext()
     with lock_context:
         with destination.open("a", encoding="utf-8") as file:
             file.write(line)
             file.flush()
             os.fsync(file.fileno())
+
+
+def append_jsonl_lines(
+    path: Path | str,
+    payloads: Iterable[dict[str, Any]],
+    with_lock: bool = True,
+) -> None:
+    """Append several JSON objects with one lock, one write and one ``fsync``."""
+
+    data = "".join(
+        json.dumps(payload, ensure_ascii=False) + "\n" for payload in payloads
+    )
+    if not data:
+        return
+    destination = Path(path)
+    _ensure_parent(destination)
+    lock_context = _locked_file(destination) if with_lock else nullcontext()
+    with lock_context:
+        with destination.open("a", encoding="utf-8") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
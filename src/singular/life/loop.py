@@ -940,7 +940,7 @@ def run(
 
     psyche = Psyche.load_state()
     belief_store = BeliefStore()
-    resource_manager = resource_manager or ResourceManager()
+    resource_manager = resource_manager or ResourceManager(path=life_root / "resources.json")
     event_bus = event_bus or get_global_event_bus()
     value_weights = load_value_weights()
     governance_policy = governance_policy or MutationGovernancePolicy(value_weights=value_weights)
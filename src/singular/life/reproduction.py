@@ -227,12 +227,11 @@ def authorize_reproduction_write(
 def compute_parent_compatibility(parent_a: dict[str, Any], parent_b: dict[str, Any]) -> float:
     """Estimate compatibility based on shared psyche keys."""
 
-    keys_a = set(parent_a.keys())
-    keys_b = set(parent_b.keys())
-    union = keys_a | keys_b
+    keys_a = parent_a.keys()
+    union = keys_a | parent_b.keys()
     if not union:
         return 1.0
-    return len(keys_a & keys_b) / len(union)
+    return len(keys_a & parent_b.keys()) / len(union)
 
 
 def _bounded_numeric_inheritance(
@@ -240,13 +239,19 @@ def _bounded_numeric_inheritance(
     val_b: float,
     *,
     rng: random.Random,
-    policy: ReproductionVariationPolicy,
+    intensity: float,
+    low: float,
+    high: float,
 ) -> float:
-    base = (val_a + val_b) / 2
-    amplitude = abs(val_a - val_b) * max(0.0, policy.mutation_intensity)
-    variation = rng.uniform(-amplitude, amplitude)
-    mutated = base + variation
-    return max(policy.numeric_min, min(policy.numeric_max, mutated))
+    """Blend two parent values with bounded variation.
+
+    ``intensity`` is the non-negative mutation intensity and ``low``/``high``
+    the policy bounds, resolved once by the caller rather than per value.
+    """
+
+    amplitude = abs(val_a - val_b) * intensity
+    mutated = (val_a + val_b) / 2 + rng.uniform(-amplitude, amplitude)
+    return max(low, min(high, mutated))
 
 
 def inherit_psyche(
@@ -256,10 +261,19 @@ def inherit_psyche(
     rng: random.Random,
     policy: ReproductionVariationPolicy,
 ) -> dict[str, Any]:
-    """Inherit psyche traits/values under variation bounds."""
+    """Inherit psyche traits/values under variation bounds.
+
+    Keys are visited in sorted order with one RNG draw each, so a seeded
+    ``rng`` yields the same child as before.  Numeric traits go through
+    :func:`_bounded_numeric_inheritance` with the policy bounds resolved once
+    for the loop; other traits pick one of the parents' non-null values.
+    """
 
+    intensity = max(0.0, policy.mutation_intensity)
+    low, high = policy.numeric_min, policy.numeric_max
+    choice = rng.choice
     child_psyche: dict[str, Any] = {}
-    for key in sorted(set(psyche_a) | set(psyche_b)):
+    for key in sorted(psyche_a.keys() | psyche_b.keys()):
         val_a = psyche_a.get(key)
         val_b = psyche_b.get(key)
         if isinstance(val_a, (int, float)) and isinstance(val_b, (int, float)):
@@ -267,12 +281,14 @@ def inherit_psyche(
                 float(val_a),
                 float(val_b),
                 rng=rng,
-                policy=policy,
+                intensity=intensity,
+                low=low,
+                high=high,
             )
             continue
         options = [v for v in (val_a, val_b) if v is not None]
         if options:
-            child_psyche[key] = rng.choice(options)
+            child_psyche[key] = choice(options)
     return child_psyche
 
 
@@ -285,8 +301,10 @@ def inherit_values(
 ) -> dict[str, Any]:
     """Inherit governance values map while bounding numeric drift."""
 
+    intensity = max(0.0, policy.mutation_intensity)
+    low, high = policy.numeric_min, policy.numeric_max
     result: dict[str, Any] = {}
-    for key in sorted(set(values_a) | set(values_b)):
+    for key in sorted(values_a.keys() | values_b.keys()):
         val_a = values_a.get(key)
         val_b = values_b.get(key)
         if isinstance(val_a, dict) and isinstance(val_b, dict):
@@ -297,7 +315,9 @@ def inherit_values(
                 float(val_a),
                 float(val_b),
                 rng=rng,
-                policy=policy,
+                intensity=intensity,
+                low=low,
+                high=high,
             )
             continue
         options = [v for v in (val_a, val_b) if v is not None]
@@ -8,7 +8,19 @@ from typing import Tuple
 from . import sandbox
 
 
-def score(code: str, runs: int = 5, alpha: float = 0.05) -> Tuple[float, float]:
+def complexity(tree: ast.AST) -> int:
+    """Return the AST node count of *tree*, the complexity used by :func:`score`."""
+
+    return sum(1 for _ in ast.walk(tree))
+
+
+def score(
+    code: str,
+    runs: int = 5,
+    alpha: float = 0.05,
+    *,
+    node_count: int | None = None,
+) -> Tuple[float, float]:
     """Return performance score and variance for *code*.
 
     The code is executed ``runs`` times inside :mod:`life.sandbox`. For each
@@ -20,7 +32,9 @@ def score(code: str, runs: int = 5, alpha: float = 0.05) -> Tuple[float, float]:
 
     The function returns a tuple ``(score, variance)`` where ``variance`` is the
     population variance of the collected timings. ``alpha`` controls the weight
-    of the complexity penalty and defaults to ``0.05``.
+    of the complexity penalty and defaults to ``0.05``. Callers that already
+    hold the parsed tree may pass its :func:`complexity` as ``node_count`` to
+    skip re-parsing *code*.
     """
 
     timings = []
@@ -32,8 +46,7 @@ def score(code: str, runs: int = 5, alpha: float = 0.05) -> Tuple[float, float]:
     median_ms = statistics.median(timings)
     variance = statistics.pvariance(timings) if len(timings) > 1 else 0.0
 
-    tree = ast.parse(code)
-    complexity = sum(1 for _ in ast.walk(tree))
-
-    score_value = median_ms + alpha * complexity
+    if node_count is None:
+        node_count = complexity(ast.parse(code))
+    score_value = median_ms + alpha * node_count
     return score_value, variance
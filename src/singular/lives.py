@@ -6,9 +6,8 @@ import json
 import logging
 import os
 import re
-import shutil
+import string
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict
 
@@ -23,6 +22,16 @@ _LEGACY_TRANSFERS_JOURNAL = "legacy_transfers.jsonl"
 
 _LOGGER = logging.getLogger(__name__)
 
+# Last registry text written per path with the (mtime_ns, size) it produced;
+# lets ``save_registry`` detect no-op saves without re-reading the file.
+_LAST_SAVED_REGISTRY: dict[Path, tuple[str, tuple[int, int]]] = {}
+
+_SLUG_ALLOWED = frozenset(string.ascii_lowercase + string.digits)
+_SLUG_ASCII_TABLE = bytes(
+    code if chr(code) in _SLUG_ALLOWED else ord("-") for code in range(256)
+)
+_SLUG_INVALID_RE = re.compile(r"[^a-z0-9]+")
+
 
 @dataclass(slots=True)
 class LifeMetadata:
@@ -152,6 +161,8 @@ def _registry_path(root: Path | None = None) -> Path:
 
 
 def _now_iso() -> str:
+    from datetime import datetime, timezone
+
     return datetime.now(timezone.utc).isoformat()
 
 
@@ -425,7 +436,23 @@ def save_registry(registry: dict[str, Any]) -> None:
         "lives": lives_payload,
     }
 
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    text = json.dumps(payload, indent=2)
+    signature = _registry_signature(path)
+    if signature is not None and _LAST_SAVED_REGISTRY.get(path) == (text, signature):
+        # Defensive saves of an unchanged registry skip the rewrite.
+        return
+    path.write_text(text, encoding="utf-8")
+    signature = _registry_signature(path)
+    if signature is not None:
+        _LAST_SAVED_REGISTRY[path] = (text, signature)
+
+
+def _registry_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
 
 def set_life_status(slug: str, status: str) -> None:
@@ -442,10 +469,35 @@ def set_life_status(slug: str, status: str) -> None:
 
 
 def _slugify(name: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+    if name.isascii():
+        # Map every non ``[a-z0-9]`` byte to ``-`` in C, then split on it:
+        # dropping empty chunks collapses runs and trims both ends without
+        # going through the regex engine.
+        raw = name.lower().encode("ascii").translate(_SLUG_ASCII_TABLE)
+        slug = b"-".join(filter(None, raw.split(b"-"))).decode("ascii")
+    else:
+        slug = _SLUG_INVALID_RE.sub("-", name.lower()).strip("-")
     return slug or "life"
 
 
+def _life_name_index(registry: dict[str, Any]) -> dict[str, str]:
+    """Return the ``name -> slug`` index of ``registry``, building it once.
+
+    The index is stored on the loaded registry under ``"by_name"`` so that
+    repeated lookups against the same snapshot are O(1).  When several lives
+    share a name the first registered one wins, matching the former scan.
+    """
+
+    by_name = registry.get("by_name")
+    if isinstance(by_name, dict):
+        return by_name
+    by_name = {}
+    for slug, meta in registry.get("lives", {}).items():
+        by_name.setdefault(meta.name, slug)
+    registry["by_name"] = by_name
+    return by_name
+
+
 def _resolve_life_metadata(name: str) -> tuple[dict[str, Any], str, LifeMetadata]:
     registry = load_registry()
     lives: dict[str, LifeMetadata] = registry.setdefault("lives", {})
@@ -463,11 +515,8 @@ def _resolve_life_metadata(name: str) -> tuple[dict[str, Any], str, LifeMetadata
             slug = candidate
             metadata = lives[candidate]
         else:
-            for candidate_slug, meta in lives.items():
-                if meta.name == name:
-                    slug = candidate_slug
-                    metadata = meta
-                    break
+            slug = _life_name_index(registry).get(name)
+            metadata = lives.get(slug) if slug is not None else None
 
     if slug is None or metadata is None:
         raise KeyError(name)
@@ -660,10 +709,9 @@ def resolve_life(name: str | None) -> Path | None:
             slug = _slugify(name)
             target = lives.get(slug)
             if target is None:
-                for meta in lives.values():
-                    if meta.name == name:
-                        target = meta
-                        break
+                by_name_slug = _life_name_index(registry).get(name)
+                if by_name_slug is not None:
+                    target = lives.get(by_name_slug)
 
     if target is None:
         return None
@@ -783,6 +831,8 @@ def reproduce_lives(
 
 
 def delete_life(name: str) -> LifeMetadata:
+    import shutil
+
     registry, slug, metadata = _resolve_life_metadata(name)
     lives: dict[str, LifeMetadata] = registry.setdefault("lives", {})
     try:
@@ -829,6 +879,8 @@ def memorialize_life(name: str, *, message: str) -> Path:
 
 
 def clone_life(name: str, *, new_name: str | None = None) -> LifeMetadata:
+    import shutil
+
     _, source_slug, source = _resolve_life_metadata(name)
     clone_name = new_name or f"{source.name} clone"
     clone_meta = create_life(clone_name, parents=(source_slug,))
@@ -847,6 +899,8 @@ def clone_life(name: str, *, new_name: str | None = None) -> LifeMetadata:
 
 
 def _remove_tree(path: Path) -> None:
+    import shutil
+
     try:
         shutil.rmtree(path)
     except FileNotFoundError:
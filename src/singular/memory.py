@@ -7,15 +7,30 @@ when the optional :mod:`PyYAML <yaml>` package is available.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Callable, Iterable, Mapping
+from typing import Any, Callable, Iterable, Iterator, Mapping
 import json
 import os
 from datetime import datetime, timedelta, timezone
 
 from .events import Event, EventBus
-from .io_utils import append_jsonl_line, atomic_write_text
+from .io_utils import (
+    append_jsonl_line,
+    append_jsonl_lines,
+    atomic_write_bytes,
+    atomic_write_text,
+)
 from .memory_layers import MemoryLayerService, build_backend
 
+_MEMORY_FILES = (
+    "profile.json",
+    "values.yaml",
+    "episodic.jsonl",
+    "causal_timeline.jsonl",
+    "generations.jsonl",
+    "skills.json",
+    "psyche.json",
+)
+
 _MEMORY_LAYER_SERVICE: MemoryLayerService | None = None
 _MEMORY_LAYER_SERVICE_ROOT: Path | None = None
 
@@ -85,6 +100,7 @@ def _append_jsonl_line(path: Path, payload: dict[str, Any]) -> None:
 
     append_jsonl_line(path, payload, with_lock=True)
 
+
 def append_jsonl_line_safe(
     path: Path | str,
     payload: Mapping[str, Any],
@@ -105,14 +121,13 @@ def ensure_memory_structure(mem_dir: Path | str | None = None) -> None:
         mem_dir = get_mem_dir()
     mem_dir = Path(mem_dir)
     mem_dir.mkdir(parents=True, exist_ok=True)
-    (mem_dir / "profile.json").touch(exist_ok=True)
-    (mem_dir / "values.yaml").touch(exist_ok=True)
-    (mem_dir / "episodic.jsonl").touch(exist_ok=True)
-    (mem_dir / "causal_timeline.jsonl").touch(exist_ok=True)
-    (mem_dir / "generations.jsonl").touch(exist_ok=True)
-    (mem_dir / "skills.json").touch(exist_ok=True)
-    (mem_dir / "psyche.json").touch(exist_ok=True)
-    (mem_dir / "layers").mkdir(parents=True, exist_ok=True)
+    # One directory listing replaces an open(O_CREAT) probe per memory file.
+    existing = set(os.listdir(mem_dir))
+    for name in _MEMORY_FILES:
+        if name not in existing:
+            (mem_dir / name).touch(exist_ok=True)
+    if "layers" not in existing:
+        (mem_dir / "layers").mkdir(parents=True, exist_ok=True)
 
 
 def get_memory_layer_service(root: Path | str | None = None) -> MemoryLayerService:
@@ -137,7 +152,8 @@ def read_profile(path: Path | str | None = None) -> dict[str, Any]:
     """Read the profile JSON file."""
     if path is None:
         path = get_profile_file()
-    path = Path(path)
+    if not isinstance(path, Path):
+        path = Path(path)
     if not path.exists():
         return {}
     with path.open(encoding="utf-8") as file:
@@ -151,8 +167,9 @@ def write_profile(profile: dict[str, Any], path: Path | str | None = None) -> No
     """Write the profile JSON file."""
     if path is None:
         path = get_profile_file()
-    path = Path(path)
-    atomic_write_text(path, json.dumps(profile))
+    if not isinstance(path, Path):
+        path = Path(path)
+    atomic_write_bytes(path, json.dumps(profile).encode("utf-8"))
 
 
 def update_trait(
@@ -177,7 +194,8 @@ def read_values(path: Path | str | None = None) -> dict[str, Any]:
     """
     if path is None:
         path = get_values_file()
-    path = Path(path)
+    if not isinstance(path, Path):
+        path = Path(path)
     if not path.exists():
         return {}
     try:
@@ -199,7 +217,8 @@ def write_values(values: dict[str, Any], path: Path | str | None = None) -> None
     """
     if path is None:
         path = get_values_file()
-    path = Path(path)
+    if not isinstance(path, Path):
+        path = Path(path)
     try:
         import yaml  # type: ignore
     except ImportError as exc:
@@ -214,21 +233,25 @@ def write_values(values: dict[str, Any], path: Path | str | None = None) -> None
 # ---------------------------------------------------------------------------
 
 
-def read_episodes(path: Path | str | None = None) -> list[dict[str, Any]]:
-    """Read all episodes from the JSONL file."""
+def iter_episodes(path: Path | str | None = None) -> Iterator[dict[str, Any]]:
+    """Yield episodes from the JSONL file one line at a time."""
     if path is None:
         path = get_episodic_file()
-    path = Path(path)
+    if not isinstance(path, Path):
+        path = Path(path)
     if not path.exists():
-        return []
-    episodes = []
+        return
     with path.open(encoding="utf-8") as file:
         for line in file:
             line = line.strip()
             if not line:
                 continue
-            episodes.append(json.loads(line))
-    return episodes
+            yield json.loads(line)
+
+
+def read_episodes(path: Path | str | None = None) -> list[dict[str, Any]]:
+    """Read all episodes from the JSONL file."""
+    return list(iter_episodes(path))
 
 
 def _episode_search_text(episode: Mapping[str, Any]) -> str:
@@ -313,26 +336,39 @@ def format_recalled_memories(memories: Iterable[Mapping[str, Any]], *, max_chars
     return f"{text[: max(0, max_chars - 3)]}..."
 
 
+def render_mood(
+    mood: str, mood_styles: Mapping[str | None, Callable[[str], str]]
+) -> str:
+    """Render ``mood`` with its style, falling back on the ``None`` style."""
+
+    style = mood_styles.get(mood) or mood_styles.get(None)
+    return style(mood) if style else mood
+
+
 def add_episode(
     episode: dict[str, Any],
     path: Path | str | None = None,
     mood_styles: Mapping[str | None, Callable[[str], str]] | None = None,
+    *,
+    encoded: str | None = None,
 ) -> None:
     """Append a new episode to the episodic memory file.
 
     If ``mood_styles`` is provided and the episode contains a ``mood`` field,
     the corresponding rendering function is applied to the mood value before the
-    episode is serialized.
+    episode is serialized.  ``encoded`` is the episode's JSON text when the
+    caller already has it; it is ignored if a mood style rewrites the episode.
     """
 
     if mood_styles and (mood := episode.get("mood")) is not None:
-        style = mood_styles.get(mood) or mood_styles.get(None) or (lambda x: x)
-        episode = {**episode, "mood": style(mood)}
+        episode = {**episode, "mood": render_mood(mood, mood_styles)}
+        encoded = None
 
     if path is None:
         path = get_episodic_file()
-    path = Path(path)
-    append_jsonl_line(path, episode)
+    if not isinstance(path, Path):
+        path = Path(path)
+    append_jsonl_line(path, episode, encoded=encoded)
     try:
         layers_root = path.parent / "layers"
         get_memory_layer_service(layers_root).ingest_episode(episode)
@@ -341,6 +377,39 @@ def add_episode(
         pass
 
 
+def add_episodes(
+    episodes: Iterable[dict[str, Any]],
+    path: Path | str | None = None,
+) -> None:
+    """Append several episodes at once to the episodic memory file.
+
+    The episodes are written with a single locked append (one ``fsync``) and
+    then ingested into the layered memory in order; as with
+    :func:`add_episode`, an episode that fails to ingest does not stop the
+    others.
+    """
+
+    batch = list(episodes)
+    if not batch:
+        return
+    if path is None:
+        path = get_episodic_file()
+    if not isinstance(path, Path):
+        path = Path(path)
+    append_jsonl_lines(path, batch)
+    try:
+        service = get_memory_layer_service(path.parent / "layers")
+    except Exception:
+        # Layered memory is best effort to preserve compatibility.
+        return
+    for episode in batch:
+        try:
+            service.ingest_episode(episode)
+        except Exception:
+            # Layered memory is best effort to preserve compatibility.
+            pass
+
+
 def read_causal_timeline(path: Path | str | None = None) -> list[dict[str, Any]]:
     """Read all causal trace entries from the causal timeline JSONL file."""
 
@@ -394,7 +463,8 @@ def read_skills(path: Path | str | None = None) -> dict[str, Any]:
     """Read the skills JSON file."""
     if path is None:
         path = get_skills_file()
-    path = Path(path)
+    if not isinstance(path, Path):
+        path = Path(path)
     if not path.exists():
         return {}
     with path.open(encoding="utf-8") as file:
@@ -408,8 +478,9 @@ def write_skills(skills: dict[str, Any], path: Path | str | None = None) -> None
     """Write the skills JSON file."""
     if path is None:
         path = get_skills_file()
-    path = Path(path)
-    atomic_write_text(path, json.dumps(skills))
+    if not isinstance(path, Path):
+        path = Path(path)
+    atomic_write_bytes(path, json.dumps(skills).encode("utf-8"))
 
 
 def update_score(
@@ -431,6 +502,26 @@ def update_score(
     return skills
 
 
+def update_scores(
+    scores: Mapping[str, float], path: Path | str | None = None
+) -> dict[str, Any]:
+    """Update several skill scores with a single read and write.
+
+    Behaves like calling :func:`update_score` for each item of ``scores``.
+    """
+
+    skills = read_skills(path)
+    for skill, score in scores.items():
+        entry = skills.get(skill)
+        if isinstance(entry, dict):
+            entry["score"] = score
+        else:
+            entry = {"score": score}
+        skills[skill] = entry
+    write_skills(skills, path)
+    return skills
+
+
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -655,22 +746,25 @@ def read_psyche(path: Path | str | None = None) -> dict[str, Any]:
     """Read the psyche JSON file."""
     if path is None:
         path = get_psyche_file()
-    path = Path(path)
-    if not path.exists():
+    if not isinstance(path, Path):
+        path = Path(path)
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return {}
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
         return {}
-    with path.open(encoding="utf-8") as file:
-        try:
-            return json.load(file)
-        except json.JSONDecodeError:
-            return {}
 
 
 def write_psyche(state: dict[str, Any], path: Path | str | None = None) -> None:
     """Write the psyche JSON file."""
     if path is None:
         path = get_psyche_file()
-    path = Path(path)
-    atomic_write_text(path, json.dumps(state))
+    if not isinstance(path, Path):
+        path = Path(path)
+    atomic_write_bytes(path, json.dumps(state).encode("utf-8"))
 
 
 _REGISTERED_MEMORY_BUS_IDS: set[int] = set()
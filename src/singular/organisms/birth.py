@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import random
+import secrets
 import string
 import json
 import hashlib
@@ -16,7 +17,7 @@ from ..environment.sim_world import default_world_state, save_world_state
 from ..goals.intrinsic import GoalState
 from ..governance.values import ValueWeights
 from ..identity import create_identity
-from ..memory import ensure_memory_structure, update_score, write_profile
+from ..memory import ensure_memory_structure, update_scores, write_profile
 from ..psyche import Psyche
 from ..life.skill_catalog import refresh_skill_catalog
 from ..resources import config_resource
@@ -24,6 +25,8 @@ from ..resources import config_resource
 _PSYCHE_TRAITS = ("curiosity", "patience", "playfulness", "optimism", "resilience")
 _PSYCHE_DEFAULTS = {trait: 0.5 for trait in _PSYCHE_TRAITS}
 _DEFAULT_STARTER_PROFILE = "assistant"
+_SOULSEED_ALPHABET = string.ascii_lowercase + string.digits
+_SKILL_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 _BIRTH_SCHEMA_VERSION = 1
 _STARTER_CONFIG_PATH = config_resource("starter_skills.yaml")
 _DEFAULT_STARTER_PROFILES: dict[str, list[str]] = {
@@ -194,6 +197,10 @@ _SKILL_TEMPLATES: dict[str, str] = {
     ),
 }
 
+_SKILL_TEMPLATE_BYTES: dict[str, bytes] = {
+    skill_id: source.encode("utf-8") for skill_id, source in _SKILL_TEMPLATES.items()
+}
+
 
 def _resolve_psyche_overrides(
     overrides: dict[str, Any] | None,
@@ -296,6 +303,18 @@ def _append_jsonl(path: Path, payload: dict[str, Any]) -> None:
         file.write(json.dumps(payload, ensure_ascii=False) + "\n")
 
 
+def _write_skill_template(skills_dir: Path, skill_id: str) -> None:
+    # Templates are pre-encoded and written through a raw descriptor to skip
+    # the TextIOWrapper/BufferedWriter setup for these tiny files.
+    fd = os.open(skills_dir / f"{skill_id}.py", _SKILL_WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(_SKILL_TEMPLATE_BYTES[skill_id])
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def _build_birth_snapshot(
     *,
     identity_payload: dict[str, Any],
@@ -369,13 +388,10 @@ def birth(
         skills_dir.mkdir(parents=True, exist_ok=True)
         selected_skills = _resolve_starter_skills(starter_profile, starter_skills)
         for skill_id in selected_skills:
-            (skills_dir / f"{skill_id}.py").write_text(
-                _SKILL_TEMPLATES[skill_id], encoding="utf-8"
-            )
-            update_score(
-                skill_id,
-                0.0,
-                path=home / "mem" / "skills.json",
+            _write_skill_template(skills_dir, skill_id)
+        if selected_skills:
+            update_scores(
+                dict.fromkeys(selected_skills, 0.0), path=home / "mem" / "skills.json"
             )
 
     refresh_skill_catalog(skills_dir=skills_dir, mem_dir=home / "mem")
@@ -384,7 +400,10 @@ def birth(
 
     # Generate a random name and soulseed for the new identity
     name = name or f"organism-{rng.randint(0, 999999):06d}"
-    soulseed = "".join(rng.choices(string.ascii_lowercase + string.digits, k=16))
+    if seed is None:
+        soulseed = secrets.token_hex(8)
+    else:
+        soulseed = "".join(rng.choices(_SOULSEED_ALPHABET, k=16))
 
     # Create the identity file and persist a base profile
     identity = create_identity(name, soulseed, path=home / "id.json")
@@ -109,5 +109,5 @@ def mutation_absurde(code: str) -> str:
     placeholder for curious but unproductive exploration.
     """
 
-    line = "0  # mutation absurde"
-    return code + ("\n" if not code.endswith("\n") else "") + line + "\n"
+    separator = "" if code.endswith("\n") else "\n"
+    return f"{code}{separator}0  # mutation absurde\n"
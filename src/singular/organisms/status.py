@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 from ..lives import list_relations
@@ -50,6 +51,26 @@ def _fmt_number(value: object, unit: str = "") -> str:
 
 
 
+def _run_files_by_mtime(runs_dir: str | os.PathLike[str]) -> list[os.DirEntry[str]]:
+    """Return ``*.jsonl`` run files ordered by modification time.
+
+    ``DirEntry`` objects cache their ``stat`` result, so sorting does not issue
+    one extra syscall (nor build one :class:`Path`) per run file.
+    """
+
+    try:
+        with os.scandir(runs_dir) as entries:
+            files = [
+                entry
+                for entry in entries
+                if entry.name.endswith(".jsonl") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+    files.sort(key=lambda entry: entry.stat().st_mtime)
+    return files
+
+
 def _read_quest_status() -> dict[str, object]:
     path = get_mem_dir() / "quests_state.json"
     if not path.exists():
@@ -259,28 +280,27 @@ def status(*, verbose: bool = False, output_format: str = "plain") -> None:
     }
     all_records: list[dict[str, object]] = []
     invalid_lines = 0
-    runs_dir = Path(RUNS_DIR)
-    files = sorted(runs_dir.glob("*.jsonl"), key=lambda p: p.stat().st_mtime)
+    files = _run_files_by_mtime(RUNS_DIR)
     if files:
         latest = files[-1]
+        # Stream every run file once; the latest run's records are collected
+        # during the same pass instead of re-reading and re-parsing its file.
+        records: list[dict[str, object]] = []
         for run_file in files:
-            with run_file.open(encoding="utf-8") as fh:
+            is_latest = run_file is latest
+            with open(run_file.path, encoding="utf-8") as fh:
                 for line in fh:
                     line = line.strip()
-                    if line:
-                        try:
-                            all_records.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            invalid_lines += 1
-        records = []
-        with latest.open(encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if line:
+                    if not line:
+                        continue
                     try:
-                        records.append(json.loads(line))
+                        record = json.loads(line)
                     except json.JSONDecodeError:
                         invalid_lines += 1
+                        continue
+                    all_records.append(record)
+                    if is_latest:
+                        records.append(record)
         payload["invalid_lines"] = invalid_lines
         payload["daily_skills"] = build_daily_skills_snapshot(records=all_records)
         if records:
@@ -304,7 +324,7 @@ def status(*, verbose: bool = False, output_format: str = "plain") -> None:
                 if isinstance(h, dict) and isinstance(h.get("score"), (int, float))
             ]
             state = detect_health_state(health_scores, short_window=10, long_window=50)
-            payload["latest_run"] = latest.stem
+            payload["latest_run"] = Path(latest.path).stem
             payload["last_execution_ms"] = (
                 round(float(ms_new), 2) if isinstance(ms_new, (int, float)) else None
             )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 import random
 import time
@@ -14,9 +15,9 @@ from uuid import uuid4
 from ..memory import (
     add_causal_trace,
     add_episode,
+    add_episodes,
     ensure_memory_structure,
     format_recalled_memories,
-    read_episodes,
 )
 from ..memory_layers import MemoryRetrievalService, build_backend
 from ..perception import capture_signals
@@ -143,6 +144,99 @@ def _extract_structured_signals(text: str) -> dict[str, object]:
     }
 
 
+def _scan_recent_episodes(
+    episodes: list[dict[str, Any]],
+) -> tuple[str | None, dict | None, dict | None, dict | None]:
+    """Return the latest user text, mutation, success and failure episodes.
+
+    A single reverse walk fills all four slots and stops as soon as the last
+    user text and both mutation outcomes have been seen.
+    """
+
+    last_event: str | None = None
+    latest_mutation: dict | None = None
+    last_success: dict | None = None
+    last_failure: dict | None = None
+    for episode in reversed(episodes):
+        if last_event is None and episode.get("role") == "user":
+            text = episode.get("text")
+            if text:
+                last_event = text
+        if episode.get("event") == "mutation":
+            if latest_mutation is None:
+                latest_mutation = episode
+            if episode.get("improved"):
+                if last_success is None:
+                    last_success = episode
+            elif last_failure is None:
+                last_failure = episode
+        if (
+            last_event is not None
+            and last_success is not None
+            and last_failure is not None
+        ):
+            break
+    return last_event, latest_mutation, last_success, last_failure
+
+
+class _EpisodeTail:
+    """Follow the episodic log incrementally for ``talk()`` context.
+
+    Each refresh parses only the complete lines appended since the previous
+    one and folds them into the cached summaries, so a long conversation no
+    longer re-reads the whole memory on every turn.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._reset()
+
+    def _reset(self) -> None:
+        self.offset = 0
+        self.summary: tuple[str | None, dict | None, dict | None, dict | None] = (
+            None,
+            None,
+            None,
+            None,
+        )
+
+    def refresh(self) -> tuple[str | None, dict | None, dict | None, dict | None]:
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size < self.offset:
+            # The log was rewritten (e.g. compacted); start over.
+            self._reset()
+        if size > self.offset:
+            with self.path.open("rb") as handle:
+                handle.seek(self.offset)
+                chunk = handle.read(size - self.offset)
+            # Leave a trailing partial line for the next refresh.
+            end = chunk.rfind(b"\n") + 1
+            new_episodes: list[dict[str, Any]] = []
+            for line in chunk[:end].splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    episode = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(episode, dict):
+                    new_episodes.append(episode)
+            self.offset += end
+            if new_episodes:
+                # Newer episodes take precedence over the cached summaries.
+                self.summary = tuple(  # type: ignore[assignment]
+                    fresh if fresh is not None else cached
+                    for fresh, cached in zip(
+                        _scan_recent_episodes(new_episodes), self.summary
+                    )
+                )
+        return self.summary
+
+
 def _trim_for_budget(text: str, budget: int) -> str:
     cleaned = " ".join(text.split())
     if budget <= 3:
@@ -228,6 +322,7 @@ def talk(
             )
 
     psyche = Psyche.load_state(psyche_file)
+    episode_tail = _EpisodeTail(episodic_file)
 
     def gather_context() -> (
         tuple[str | None, dict | None, dict | None, str | None, str | None]
@@ -235,36 +330,7 @@ def talk(
         signals = capture_signals()
         add_episode({"event": "perception", **signals}, path=episodic_file)
         psyche.consume()
-        episodes = read_episodes(episodic_file)
-        episodes_by_role = {
-            "user": [e for e in episodes if e.get("role") == "user"],
-            "assistant": [e for e in episodes if e.get("role") == "assistant"],
-        }
-        user_episodes = episodes_by_role["user"]
-        last_event = next(
-            (e.get("text") for e in reversed(user_episodes) if e.get("text")),
-            None,
-        )
-        latest_mutation = next(
-            (e for e in reversed(episodes) if e.get("event") == "mutation"),
-            None,
-        )
-        last_success = next(
-            (
-                e
-                for e in reversed(episodes)
-                if e.get("event") == "mutation" and e.get("improved")
-            ),
-            None,
-        )
-        last_failure = next(
-            (
-                e
-                for e in reversed(episodes)
-                if e.get("event") == "mutation" and not e.get("improved")
-            ),
-            None,
-        )
+        last_event, latest_mutation, last_success, last_failure = episode_tail.refresh()
         mood_event = latest_mutation.get("mood") if latest_mutation else None
         perf_msg = None
         if latest_mutation:
@@ -312,32 +378,32 @@ def talk(
         recalled_memories = retrieval.within_budget(recalled_memories, 120)
         recall_summary = format_recalled_memories(recalled_memories)
         # General small-talk may reuse immediate context without creating two
-        # self-referential audit episodes on every turn.
+        # self-referential audit episodes on every turn.  The turn's pre-reply
+        # episodes are appended together to pay for a single lock and fsync.
+        turn_episodes: list[dict[str, Any]] = []
         if recalled_memories and theme != "general":
-            add_episode(
+            turn_episodes.append(
                 {
                     "event": "memory.recalled",
                     "source": "talk",
                     "query": user_input,
                     "memories": recalled_memories,
                     "summary": recall_summary,
-                },
-                path=episodic_file,
+                }
             )
-            add_episode(
+            turn_episodes.append(
                 {
                     "event": "memory.used_for_decision",
                     "source": "talk",
                     "decision": "assistant_reply",
                     "memories": recalled_memories,
                     "summary": recall_summary,
-                },
-                path=episodic_file,
+                }
             )
-        add_episode(
-            {"role": "user", "text": user_input, "structured_signals": user_signals},
-            path=episodic_file,
+        turn_episodes.append(
+            {"role": "user", "text": user_input, "structured_signals": user_signals}
         )
+        add_episodes(turn_episodes, path=episodic_file)
         mood = psyche.feel(Mood.NEUTRAL)
         mood_report = mood_event or mood.value
         system_preamble = _build_system_preamble(
@@ -425,20 +491,16 @@ def talk(
             life_root=life_root,
         )
 
-        parts = [reply]
-        should_add_reminder = bool(last_event) and (
-            "Reminder:" not in reply and last_event not in reply
-        )
-        if should_add_reminder:
-            parts.append(f"Reminder: {last_event}")
+        response = reply
+        if last_event and "Reminder:" not in reply and last_event not in reply:
+            response += f" | Reminder: {last_event}"
         if last_success:
-            parts.append(f"Last success: {last_success.get('op')}")
+            response += f" | Last success: {last_success.get('op')}"
         if last_failure:
-            parts.append(f"Last failure: {last_failure.get('op')}")
+            response += f" | Last failure: {last_failure.get('op')}"
         if perf_msg:
-            parts.append(perf_msg)
-        parts.append(f"Mood: {mood_report}")
-        response = " | ".join(parts)
+            response += f" | {perf_msg}"
+        response += f" | Mood: {mood_report}"
 
         print(response)
         add_episode(
@@ -529,8 +591,8 @@ def talk(
         return
 
     while True:
-        context = gather_context()
-        self_narrative = load_self_narrative(narrative_file)
+        # Prompt first so that leaving the conversation does not pay for a
+        # perception capture and an episode refresh that nobody will use.
         try:
             user_input = input("you: ")
         except EOFError:
@@ -542,6 +604,8 @@ def talk(
         if user_input.strip().lower() in {"exit", "quit"}:
             break
 
+        context = gather_context()
+        self_narrative = load_self_narrative(narrative_file)
         respond(
             user_input,
             *context,
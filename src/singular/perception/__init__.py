@@ -42,11 +42,34 @@ def _read_optional_file() -> dict[str, Any]:
         return {}
 
 
+_DEFAULT_WEATHER_TTL_SECONDS = 60.0
+# Successful weather responses keyed by URL: ``url -> (fetched_at, payload)``.
+_WEATHER_CACHE: dict[str, tuple[float, Any]] = {}
+
+
+def _weather_ttl_seconds() -> float:
+    try:
+        return float(
+            stdlib_os.getenv("SINGULAR_WEATHER_TTL", str(_DEFAULT_WEATHER_TTL_SECONDS))
+        )
+    except ValueError:
+        return _DEFAULT_WEATHER_TTL_SECONDS
+
+
 def _query_optional_weather_api() -> dict[str, Any]:
-    """Query ``SINGULAR_WEATHER_API`` for weather data if possible."""
+    """Query ``SINGULAR_WEATHER_API`` for weather data if possible.
+
+    Successful responses are reused for ``SINGULAR_WEATHER_TTL`` seconds
+    (60 by default, ``0`` disables caching) so perception loops do not issue
+    one blocking HTTP request per iteration.
+    """
     url = stdlib_os.getenv("SINGULAR_WEATHER_API")
     if not url:
         return {}
+    now = time.monotonic()
+    cached = _WEATHER_CACHE.get(url)
+    if cached is not None and now - cached[0] < _weather_ttl_seconds():
+        return {"weather": cached[1]}
     try:  # pragma: no cover - network failures are expected
         import requests  # type: ignore[import-untyped]
 
@@ -57,9 +80,11 @@ def _query_optional_weather_api() -> dict[str, Any]:
             timeout = 5.0
         response = requests.get(url, timeout=timeout)
         response.raise_for_status()
-        return {"weather": response.json()}
+        weather = response.json()
     except Exception:
         return {}
+    _WEATHER_CACHE[url] = (now, weather)
+    return {"weather": weather}
 
 
 def _resolve_sandbox_root(path: str | Path | None) -> Path:
@@ -589,6 +614,7 @@ def reset_perception_state() -> None:
 
     _ARTIFACT_STATE.files_mtime.clear()
     _ARTIFACT_STATE.seen_logs.clear()
+    _WEATHER_CACHE.clear()
     _NOISE_FILTER._seen_signatures.clear()
     _NOISE_FILTER._last_emitted_at.clear()
 
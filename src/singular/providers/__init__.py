@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from importlib import import_module
-from importlib.metadata import entry_points
+from importlib.metadata import EntryPoint, entry_points
 import inspect
 import os
 from typing import Any, Callable, Protocol
@@ -329,6 +329,18 @@ def provider_diagnostics(names: list[str] | None = None) -> dict[str, Any]:
     }
 
 
+def _strip_non_printable(text: str) -> str:
+    """Return ``text`` without the characters rejected by ``str.isprintable``."""
+
+    if text.isprintable():
+        return text
+    # Build the deletion table from this string only so nothing accumulates
+    # across calls, whatever code points model output contains.
+    return text.translate(
+        dict.fromkeys(ord(ch) for ch in set(text) if not ch.isprintable())
+    )
+
+
 def _invoke_provider(fn: Callable[..., Any], **kwargs: Any) -> Any:
     """Invoke provider callables while supporting legacy signatures."""
 
@@ -356,6 +368,22 @@ def _resolve_provider_chain(name: str | None) -> list[str]:
     return list(DEFAULT_FALLBACK_CHAIN)
 
 
+_LLM_ENTRY_POINTS: dict[str, EntryPoint] | None = None
+
+
+def _llm_entry_points() -> dict[str, EntryPoint]:
+    """Return ``singular.llm`` entry points by name, scanning distributions once."""
+
+    global _LLM_ENTRY_POINTS
+    if _LLM_ENTRY_POINTS is None:
+        found: dict[str, EntryPoint] = {}
+        for ep in entry_points(group="singular.llm"):
+            # Keep the first registration, as the former linear scan did.
+            found.setdefault(ep.name, ep)
+        _LLM_ENTRY_POINTS = found
+    return _LLM_ENTRY_POINTS
+
+
 def _load_provider_contract(name: str) -> LLMProviderContract | None:
     module_name = f"singular.providers.llm_{name}"
     try:
@@ -387,9 +415,8 @@ def _load_provider_contract(name: str) -> LLMProviderContract | None:
                 f"Provider '{name}' imports missing dependency '{exc.name}'"
             ) from exc
 
-    for ep in entry_points(group="singular.llm"):
-        if ep.name != name:
-            continue
+    ep = _llm_entry_points().get(name)
+    if ep is not None:
         obj = ep.load()
         generate = getattr(obj, "generate", getattr(obj, "generate_reply", obj))
         embed = getattr(
@@ -452,9 +479,30 @@ def load_llm_client(name: str | None) -> LLMProviderClient | None:
     )
 
 
+# Providers loaded by :func:`load_llm_provider`, keyed by explicit name.
+_LLM_PROVIDERS: dict[str, Callable[[str], str]] = {}
+
+
 def load_llm_provider(name: str | None) -> Callable[[str], str] | None:
-    """Backward-compatible loader returning a plain ``generate_reply`` callable."""
+    """Backward-compatible loader returning a plain ``generate_reply`` callable.
+
+    Explicit provider names are resolved once per process.  A name listing no
+    provider (``None``, ``""``, ``" , "``) follows the ``LLM_PROVIDER_FALLBACK``
+    environment variable and is therefore never cached, nor is a provider that
+    could not be loaded.
+    """
+
+    if not name or not name.replace(",", "").strip():
+        return _build_llm_provider(name)
+    provider = _LLM_PROVIDERS.get(name)
+    if provider is None:
+        provider = _build_llm_provider(name)
+        if provider is not None:
+            _LLM_PROVIDERS[name] = provider
+    return provider
+
 
+def _build_llm_provider(name: str | None) -> Callable[[str], str] | None:
     client = load_llm_client(name)
     if client is None:
         return None
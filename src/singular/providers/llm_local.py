@@ -6,7 +6,13 @@ from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 import time
 from typing import Any
 
-from . import ProviderExecutionError, ProviderMetrics, ProviderTimeoutError, ProviderUnavailableError
+from . import (
+    ProviderExecutionError,
+    ProviderMetrics,
+    ProviderTimeoutError,
+    ProviderUnavailableError,
+    _strip_non_printable,
+)
 
 MAX_RETRIES = 1
 
@@ -37,7 +43,7 @@ def _get_pipe() -> Any:
 def _filter(text: str) -> str:
     """Return only printable characters from ``text``."""
 
-    return "".join(ch for ch in text if ch.isprintable())
+    return _strip_non_printable(text)
 
 
 def _infer(pipe: Any, prompt: str) -> str:
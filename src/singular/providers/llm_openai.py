@@ -13,6 +13,7 @@ from . import (
     ProviderQuotaExceededError,
     ProviderTimeoutError,
     ProviderUnavailableError,
+    _strip_non_printable,
 )
 
 MAX_RETRIES = 2
@@ -38,7 +39,7 @@ except Exception:  # pragma: no cover - handle missing package
 
 def _filter(text: str) -> str:
     """Return only printable characters from ``text``."""
-    return "".join(ch for ch in text if ch.isprintable())
+    return _strip_non_printable(text)
 
 
 def generate(prompt: str, *, timeout: float = 8.0) -> str:
@@ -9,6 +9,8 @@ from . import ProviderMetrics
 
 LAST_METRICS = ProviderMetrics(provider="stub")
 
+_GREETING_RE = re.compile(r"\b(?:hi|hello|salut|bonjour)\b")
+
 
 def generate(prompt: str, *, timeout: float = 8.0) -> str:
     """Generate a deterministic reply without network access."""
@@ -16,7 +18,7 @@ def generate(prompt: str, *, timeout: float = 8.0) -> str:
     LAST_METRICS.latency_ms = min(timeout * 5.0, 10.0)
     LAST_METRICS.input_tokens = len(prompt.split())
     text = prompt.strip().lower()
-    if re.search(r"\b(hi|hello|salut|bonjour)\b", text):
+    if _GREETING_RE.search(text):
         reply = "Hello!"
     elif text.endswith("?"):
         reply = "I'm not sure about that."
@@ -3,18 +3,32 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, ClassVar, Mapping, Sequence
+from typing import Dict, Any, ClassVar, Iterable, Mapping, Sequence
 from pathlib import Path
 import random
 from enum import Enum
+from types import MappingProxyType
 
-from .memory import read_psyche, write_psyche
+from .memory import get_psyche_file, read_psyche, write_psyche
 from .motivation import GoalPolicy, Objective
 from .resource_manager import ResourceManager
 
 
 class Mood(Enum):
-    """Enumerate all possible moods."""
+    """Enumerate all possible moods.
+
+    Members keep their string value for persistence and also carry an
+    ``ordinal`` (declaration order) used to index the per-mood tables of
+    :class:`Psyche`.
+    """
+
+    ordinal: int
+
+    def __new__(cls, value: str) -> "Mood":
+        member = object.__new__(cls)
+        member._value_ = value
+        member.ordinal = len(cls.__members__)
+        return member
 
     PROUD = "proud"
     FRUSTRATED = "frustrated"
@@ -43,6 +57,39 @@ def _clamp(value: float, minimum: float = 0.0, maximum: float = 1.0) -> float:
     return max(minimum, min(maximum, value))
 
 
+_MOOD_HISTORY_LIMIT = 256
+
+# Traits driven by :attr:`Psyche._MOOD_EFFECTS`, in :attr:`Psyche._MOOD_DELTAS` order.
+_TRAITS = ("curiosity", "patience", "playfulness", "optimism", "resilience")
+
+
+# Parsed psyche files keyed by path: ``path -> ((inode, mtime_ns, size), state)``.
+_LOADED_STATES: dict[Path, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+
+
+def _state_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _read_state(path: Path) -> dict[str, Any]:
+    """Return the psyche payload at ``path``, skipping unchanged re-parses."""
+
+    signature = _state_signature(path)
+    if signature is None:
+        _LOADED_STATES.pop(path, None)
+        return read_psyche(path)
+    cached = _LOADED_STATES.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    data = read_psyche(path)
+    _LOADED_STATES[path] = (signature, data)
+    return data
+
+
 def derive_mood(record: dict) -> Mood:
     """Derive a mood from a run ``record``.
 
@@ -181,20 +228,20 @@ def choose_action_from_psyche(
     add("simulated_world_task", 0.10 * exploration_pressure + 0.10 * opportunity)
 
     reason_parts: list[str] = []
-    if mood == Mood.FATIGUE or effective_energy < 25.0:
+    if mood is Mood.FATIGUE or effective_energy < 25.0:
         add("rest", 3.0)
         reason_parts.append(
             f"fatigue_or_low_energy(mood={mood.value}, energy={effective_energy:.1f}) favors rest"
         )
-    if mood == Mood.CURIOUS or getattr(psyche, "curiosity", 0.0) >= 0.7:
+    if mood is Mood.CURIOUS or getattr(psyche, "curiosity", 0.0) >= 0.7:
         add("move", 2.2)
         add("forage", 1.0)
         reason_parts.append("curiosity favors exploration")
-    if mood == Mood.ANGER:
+    if mood is Mood.ANGER:
         add("compete", 2.4)
         add("avoid_threat", 0.5)
         reason_parts.append("anger favors controlled competition")
-    if mood == Mood.LONELY or loneliness >= 0.65:
+    if mood is Mood.LONELY or loneliness >= 0.65:
         add("cooperate", 2.5)
         add("share_resource", 1.2)
         reason_parts.append("loneliness favors cooperation")
@@ -214,7 +261,7 @@ def choose_action_from_psyche(
     return PsycheActionDecision(action=action, reason=reason, scores=scores)
 
 
-@dataclass
+@dataclass(slots=True)
 class Psyche:
     """Represents mutable traits and current mood of an organism.
 
@@ -246,10 +293,17 @@ class Psyche:
     # queried by other subsystems (interaction and mutation policies).
     last_mood: Mood | None = field(default=None, init=False)
 
+    # Single-entry memo of ``(last_mood, optimism, resilience, interaction,
+    # mutation)`` shared by the policy helpers; :meth:`feel` clears it.
+    _policy_cache: tuple[Mood | None, float, float, str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     # Mapping of moods to their effects on the internal traits. The deltas are
-    # added after every event and clamped.
-    _MOOD_EFFECTS: Dict[Mood, Dict[str, float]] = field(
-        default_factory=lambda: {
+    # added after every event and clamped. The mood tables are read-only and
+    # shared by every instance.
+    _MOOD_EFFECTS: ClassVar[Mapping[Mood, Mapping[str, float]]] = MappingProxyType(
+        {
             Mood.PROUD: {
                 "curiosity": 0.1,
                 "patience": 0.05,
@@ -297,53 +351,76 @@ class Psyche:
                 "optimism": -0.1,
                 "resilience": -0.1,
             },
-        },
-        init=False,
-        repr=False,
+        }
     )
 
-    _INTERACTION_POLICIES: Dict[Mood, str] = field(
-        default_factory=lambda: {
+    # Same deltas as positional tuples ordered like ``_TRAITS``, indexed by
+    # ``Mood.ordinal`` so :meth:`feel` can update the trait fields directly.
+    _MOOD_DELTAS: ClassVar[tuple[tuple[float, ...], ...]] = tuple(
+        tuple(effects.get(trait, 0.0) for trait in _TRAITS)
+        for effects in map(_MOOD_EFFECTS.__getitem__, Mood)
+    )
+
+    # Policy tables indexed by ``Mood.ordinal``; moods without a dedicated
+    # entry hold the default.
+    _INTERACTION_POLICIES: ClassVar[tuple[str, ...]] = tuple(
+        {
             Mood.PROUD: "engaging",
             Mood.FRUSTRATED: "retry",
             Mood.ANXIOUS: "cautious",
-            Mood.NEUTRAL: "balanced",
-        },
-        init=False,
-        repr=False,
+        }.get(mood, "balanced")
+        for mood in Mood
     )
 
-    _MUTATION_POLICIES: Dict[Mood, str] = field(
-        default_factory=lambda: {
+    _MUTATION_POLICIES: ClassVar[tuple[str, ...]] = tuple(
+        {
             Mood.PROUD: "exploit",
             Mood.FRUSTRATED: "explore",
             Mood.ANXIOUS: "analyze",
-            Mood.NEUTRAL: "default",
-        },
-        init=False,
-        repr=False,
+        }.get(mood, "default")
+        for mood in Mood
     )
 
-    _MUTATION_RATES: Dict[Mood, float] = field(
-        default_factory=lambda: {
+    _MUTATION_RATES: ClassVar[tuple[float, ...]] = tuple(
+        {
             Mood.FRUSTRATED: 2.0,
             Mood.ANXIOUS: 0.5,
             Mood.PROUD: 1.2,
-            Mood.NEUTRAL: 1.0,
-        },
-        init=False,
-        repr=False,
+        }.get(mood, 1.0)
+        for mood in Mood
     )
 
-    _RESOURCE_MOOD_MAP: Dict[str, Mood] = field(
-        default_factory=lambda: {
+    # Probability of an irrational refusal or delay, indexed by ``Mood.ordinal``.
+    _IRRATIONAL_BASE: ClassVar[tuple[float, ...]] = tuple(
+        {
+            Mood.PROUD: 0.05,
+            Mood.FRUSTRATED: 0.3,
+            Mood.ANXIOUS: 0.2,
+        }.get(mood, 0.1)
+        for mood in Mood
+    )
+
+    # Objective weight modulation per mood, indexed by ``Mood.ordinal``.
+    _GOAL_MODULATION: ClassVar[tuple[float, ...]] = tuple(
+        {
+            Mood.PROUD: 1.08,
+            Mood.CURIOUS: 1.05,
+            Mood.PLEASURE: 1.06,
+            Mood.FRUSTRATED: 0.92,
+            Mood.ANXIOUS: 0.95,
+            Mood.PAIN: 0.9,
+            Mood.FATIGUE: 0.88,
+        }.get(mood, 1.0)
+        for mood in Mood
+    )
+
+    _RESOURCE_MOOD_MAP: ClassVar[Mapping[str, Mood]] = MappingProxyType(
+        {
             "tired": Mood.FATIGUE,
             "angry": Mood.ANGER,
             "cold": Mood.LONELY,
             "content": Mood.PLEASURE,
-        },
-        init=False,
-        repr=False,
+        }
     )
 
     _SOCIAL_KEYS: ClassVar[tuple[str, ...]] = (
@@ -353,8 +430,8 @@ class Psyche:
         "resentment",
     )
 
-    _SOCIAL_EVENT_DELTAS: Dict[str, Dict[str, float]] = field(
-        default_factory=lambda: {
+    _SOCIAL_EVENT_DELTAS: ClassVar[Mapping[str, Mapping[str, float]]] = MappingProxyType(
+        {
             "help.completed": {
                 "gratitude": 0.20,
                 "loyalty": 0.10,
@@ -379,16 +456,14 @@ class Psyche:
                 "jealousy": -0.10,
                 "resentment": -0.10,
             },
-        },
-        init=False,
-        repr=False,
+        }
     )
 
     @property
     def mutation_rate(self) -> float:
         """Return a mutation rate derived from the latest mood."""
         mood = self.last_mood or Mood.NEUTRAL
-        return self._MUTATION_RATES.get(mood, 1.0)
+        return self._MUTATION_RATES[mood.ordinal]
 
     def update_from_resource_manager(self, rm: ResourceManager) -> Mood:
         """Adjust mood based on ``rm`` resource metrics.
@@ -425,6 +500,11 @@ class Psyche:
         ACCEPT = "ACCEPT"
         CURIOUS = "CURIOUS"
 
+    _IRRATIONAL_OUTCOMES: ClassVar[tuple[Decision, ...]] = (
+        Decision.REFUSE,
+        Decision.DELAY,
+    )
+
     def irrational_decision(
         self, rng: random.Random | None = None
     ) -> "Psyche.Decision":
@@ -437,15 +517,14 @@ class Psyche:
 
         if rng is None:
             rng = random.Random()
-        mood = self.last_mood or Mood.NEUTRAL
-        base = {
-            Mood.PROUD: 0.05,
-            Mood.FRUSTRATED: 0.3,
-            Mood.ANXIOUS: 0.2,
-        }.get(mood, 0.1)
-        if rng.random() < base:
-            return rng.choice([self.Decision.REFUSE, self.Decision.DELAY])
-        if rng.random() < self.curiosity * 0.01:
+        base = self._IRRATIONAL_BASE[(self.last_mood or Mood.NEUTRAL).ordinal]
+        # One draw covers both branches: ``[0, base)`` is irrational and the
+        # next ``(1 - base) * curiosity * 0.01`` slice is curious, the same
+        # probabilities as a second draw made after a rational outcome.
+        draw = rng.random()
+        if draw < base:
+            return rng.choice(self._IRRATIONAL_OUTCOMES)
+        if draw < base + (1.0 - base) * self.curiosity * 0.01:
             return self.Decision.CURIOUS
         return self.Decision.ACCEPT
 
@@ -460,6 +539,19 @@ class Psyche:
         self.feel(derive_mood(record))
         self.save_state()
 
+    def process_run_records(self, records: Iterable[dict]) -> None:
+        """Process several run ``records`` and persist the psyche once.
+
+        Equivalent to calling :meth:`process_run_record` for each record in
+        order, but :meth:`save_state` only runs after the last one, which
+        suits replaying a whole run log.
+        """
+
+        feel = self.feel
+        for record in records:
+            feel(derive_mood(record))
+        self.save_state()
+
     def social_state(self, target_life: str) -> Dict[str, float]:
         """Return social state for ``target_life``, creating defaults if missing."""
 
@@ -532,58 +624,71 @@ class Psyche:
         Mood
             The mood resulting from the event.
         """
-        mood = event
-        if mood not in self._MOOD_EFFECTS:
-            mood = Mood.NEUTRAL
+        mood = event if type(event) is Mood else Mood.NEUTRAL
+        deltas = self._MOOD_DELTAS[mood.ordinal]
         self.last_mood = mood
-        self.mood_history.append(mood.value)
-        if len(self.mood_history) > 256:
-            self.mood_history = self.mood_history[-256:]
-
-        for attr, delta in self._MOOD_EFFECTS[mood].items():
-            value = getattr(self, attr)
-            setattr(self, attr, _clamp(value + delta))
-
-        if mood == Mood.PLEASURE:
-            for obj in self.objectives.values():
-                obj.apply_delta(0.1)
-        elif mood == Mood.PAIN:
-            for obj in self.objectives.values():
-                obj.apply_delta(-0.1)
-        self.adjust_objectives()
+        self._policy_cache = None
+        history = self.mood_history
+        history.append(mood.value)
+        if len(history) > _MOOD_HISTORY_LIMIT:
+            # Trim in place: a full history otherwise copies 256 entries per event.
+            del history[:-_MOOD_HISTORY_LIMIT]
+
+        # ``value <= 1.0`` keeps ``_clamp``'s handling of NaN (clamped to 1).
+        curiosity, patience, playfulness, optimism, resilience = deltas
+        if curiosity:
+            value = self.curiosity + curiosity
+            self.curiosity = 0.0 if value < 0.0 else (value if value <= 1.0 else 1.0)
+        if patience:
+            value = self.patience + patience
+            self.patience = 0.0 if value < 0.0 else (value if value <= 1.0 else 1.0)
+        if playfulness:
+            value = self.playfulness + playfulness
+            self.playfulness = 0.0 if value < 0.0 else (value if value <= 1.0 else 1.0)
+        if optimism:
+            value = self.optimism + optimism
+            self.optimism = 0.0 if value < 0.0 else (value if value <= 1.0 else 1.0)
+        if resilience:
+            value = self.resilience + resilience
+            self.resilience = 0.0 if value < 0.0 else (value if value <= 1.0 else 1.0)
+
+        objectives = self.objectives
+        if objectives:
+            if mood is Mood.PLEASURE or mood is Mood.PAIN:
+                delta = 0.1 if mood is Mood.PLEASURE else -0.1
+                for obj in objectives.values():
+                    obj.apply_delta(delta)
+            self.adjust_objectives()
 
         return mood
 
     def adjust_objectives(self) -> None:
         """Clamp and rebalance objective weights for arbitration."""
+        objectives = self.objectives
+        if not objectives:
+            return
         modulation = self.goal_modulation_profile()
-        for name, obj in self.objectives.items():
-            horizon_boost = 0.0
-            if obj.horizon_ticks is not None:
-                horizon_boost = 0.15 if obj.horizon_ticks <= 10 else -0.05
-            parent_boost = 0.0
-            if obj.parent and obj.parent in self.objectives:
-                parent_boost = self.objectives[obj.parent].weight * 0.1
-            policy_signal = obj.arbitration_score()
-            obj.weight = _clamp(
+        # Parents are read as the loop goes, so a parent updated earlier in
+        # this pass already contributes its new weight.
+        for obj in objectives.values():
+            horizon_ticks = obj.horizon_ticks
+            horizon_boost = (
+                0.0 if horizon_ticks is None else (0.15 if horizon_ticks <= 10 else -0.05)
+            )
+            parent = objectives.get(obj.parent) if obj.parent else None
+            parent_boost = 0.0 if parent is None else parent.weight * 0.1
+            weight = (
                 obj.weight * modulation
                 + horizon_boost
                 + parent_boost
-                + (policy_signal - 0.5) * 0.2
+                + (obj.arbitration_score() - 0.5) * 0.2
             )
+            # ``weight <= 1.0`` keeps ``_clamp``'s handling of NaN (clamped to 1).
+            obj.weight = 0.0 if weight < 0.0 else (weight if weight <= 1.0 else 1.0)
 
     def goal_modulation_profile(self) -> float:
         """Return a modulation factor derived from mood and recent history."""
-        mood = self.last_mood or Mood.NEUTRAL
-        mood_factor = {
-            Mood.PROUD: 1.08,
-            Mood.CURIOUS: 1.05,
-            Mood.PLEASURE: 1.06,
-            Mood.FRUSTRATED: 0.92,
-            Mood.ANXIOUS: 0.95,
-            Mood.PAIN: 0.9,
-            Mood.FATIGUE: 0.88,
-        }.get(mood, 1.0)
+        mood_factor = self._GOAL_MODULATION[(self.last_mood or Mood.NEUTRAL).ordinal]
         if not self.objectives:
             return mood_factor
         reward_signal = sum(obj.reward for obj in self.objectives.values()) / max(
@@ -666,21 +771,39 @@ class Psyche:
                 return "engaging"
             if cooperation <= 0.35:
                 return "cautious"
-        mood = self.last_mood or Mood.NEUTRAL
-        if self.optimism >= 0.7:
-            return "engaging"
-        if self.resilience <= 0.3:
-            return "cautious"
-        return self._INTERACTION_POLICIES.get(mood, "balanced")
+        return self._mood_policies()[3]
 
     def mutation_policy(self) -> str:
         """Return the mutation policy based on mood and traits."""
-        mood = self.last_mood or Mood.NEUTRAL
-        if self.resilience >= 0.7:
-            return "exploit"
-        if self.optimism <= 0.3:
-            return "analyze"
-        return self._MUTATION_POLICIES.get(mood, "default")
+        return self._mood_policies()[4]
+
+    def _mood_policies(self) -> tuple[Mood | None, float, float, str, str]:
+        """Return the memoized interaction and mutation policies."""
+        cached = self._policy_cache
+        last_mood, optimism, resilience = self.last_mood, self.optimism, self.resilience
+        if (
+            cached is not None
+            and cached[0] is last_mood
+            and cached[1] == optimism
+            and cached[2] == resilience
+        ):
+            return cached
+        ordinal = (last_mood or Mood.NEUTRAL).ordinal
+        if optimism >= 0.7:
+            interaction = "engaging"
+        elif resilience <= 0.3:
+            interaction = "cautious"
+        else:
+            interaction = self._INTERACTION_POLICIES[ordinal]
+        if resilience >= 0.7:
+            mutation = "exploit"
+        elif optimism <= 0.3:
+            mutation = "analyze"
+        else:
+            mutation = self._MUTATION_POLICIES[ordinal]
+        cached = (last_mood, optimism, resilience, interaction, mutation)
+        self._policy_cache = cached
+        return cached
 
     # Energy management ---------------------------------------------------
     def consume(self, amount: float = 1.0) -> float:
@@ -753,18 +876,18 @@ class Psyche:
                 }
                 for name, obj in self.objectives.items()
             }
-        if path is None:
-            write_psyche(state)
-        else:
-            write_psyche(state, Path(path))
+        target = get_psyche_file() if path is None else Path(path)
+        write_psyche(state, target)
+        _LOADED_STATES.pop(target, None)
 
     @classmethod
     def load_state(cls, path: Path | str | None = None) -> "Psyche":
-        """Load psyche state from disk and return a new instance."""
-        if path is None:
-            data = read_psyche()
-        else:
-            data = read_psyche(Path(path))
+        """Load psyche state from disk and return a new instance.
+
+        The parsed file is reused while its ``(inode, mtime_ns, size)`` signature is
+        unchanged; the returned instance never aliases the cached payload.
+        """
+        data = _read_state(get_psyche_file() if path is None else Path(path))
         objectives_payload = data.get("objectives", {})
         if not isinstance(objectives_payload, dict):
             objectives_payload = {}
@@ -814,7 +937,7 @@ class Psyche:
                 for target, values in social_payload.items()
                 if isinstance(values, dict)
             },
-            mood_history=[str(entry) for entry in mood_history[-256:]],
+            mood_history=[str(entry) for entry in mood_history[-_MOOD_HISTORY_LIMIT:]],
             identity_commitments={
                 "values": [str(v) for v in data.get("identity_commitments", {}).get("values", ["coherence", "safety", "utility"])],
                 "red_lines": [str(v) for v in data.get("identity_commitments", {}).get("red_lines", ["harm_user", "silent_data_loss"])],
@@ -2,15 +2,17 @@ from __future__ import annotations
 
 import argparse
 import json
-from dataclasses import dataclass
+import math
+import os
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import List
 from uuid import uuid4
 
-from .memory import add_causal_trace
-from .memory import _atomic_write_text
+from .io_utils import atomic_write_bytes
+from .memory import add_causal_trace, get_base_dir
 
 
 class CapabilityStatus(str, Enum):
@@ -20,12 +22,56 @@ class CapabilityStatus(str, Enum):
     UNSTABLE = "unstable"
 
 
-@dataclass
+_STATE_FIELDS = ("energy", "food", "warmth", "ecological_debt", "relational_debt")
+_STATE_TEMPLATE = "{" + ", ".join(f'"{name}": %r' for name in _STATE_FIELDS) + "}"
+
+# Resource moods in report order; bit ``i`` of a :meth:`ResourceManager.mood`
+# mask selects ``_RESOURCE_MOODS[i]``.
+_RESOURCE_MOODS = ("tired", "angry", "cold", "tense", "strained")
+_MOOD_TABLE = tuple(
+    tuple(name for bit, name in enumerate(_RESOURCE_MOODS) if mask >> bit & 1)
+    or ("content",)
+    for mask in range(1 << len(_RESOURCE_MOODS))
+)
+
+# Parsed resource files keyed by path: ``path -> ((ino, mtime_ns, size), state)``.
+# The inode catches same-size atomic rewrites within the mtime granularity.
+_LOADED_STATES: dict[Path, tuple[tuple[int, int, int], dict[str, float]]] = {}
+
+
+def _read_state(path: Path) -> dict[str, float] | None:
+    """Return the resource values stored at ``path``, skipping unchanged re-parses."""
+
+    # A single open serves both the signature and the payload, so they always
+    # describe the same file even if it is atomically replaced meanwhile.
+    try:
+        with open(path, "rb") as handle:
+            stat = os.fstat(handle.fileno())
+            signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            cached = _LOADED_STATES.get(path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            raw = handle.read()
+    except OSError:
+        _LOADED_STATES.pop(path, None)
+        return None
+    try:
+        data = json.loads(raw)
+    except Exception:
+        return None
+    # A corrupted field raises, as reading an unparsable value always did.
+    state = {name: float(data[name]) for name in _STATE_FIELDS if name in data}
+    _LOADED_STATES[path] = (signature, state)
+    return state
+
+
+@dataclass(slots=True)
 class ResourceManager:
     """Track and mutate basic survival resources.
 
-    The state is optionally persisted to ``path`` so separate processes can
-    communicate through a simple file based protocol.  Energy, food and warmth
+    The state is optionally persisted to ``path`` (``resources.json`` under
+    ``SINGULAR_HOME`` by default) so separate processes can communicate
+    through a simple file based protocol.  Energy, food and warmth
     values are kept in the ``[0, 100]`` range.
     """
 
@@ -34,7 +80,7 @@ class ResourceManager:
     warmth: float = 50.0
     ecological_debt: float = 0.0
     relational_debt: float = 0.0
-    path: Path = Path("resources.json")
+    path: Path = field(default_factory=lambda: get_base_dir() / "resources.json")
     energy_threshold: float = 20.0
     food_threshold: float = 20.0
     warmth_threshold: float = 20.0
@@ -42,56 +88,95 @@ class ResourceManager:
     minimum_viable_food: float = 8.0
     minimum_viable_warmth: float = 8.0
     critical_debt_threshold: float = 85.0
+    # ``autosave=False`` defers every write until :meth:`flush`; a ``with``
+    # block does the same temporarily and flushes once on exit.
+    autosave: bool = True
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
+    _batch_depth: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        if self.path.exists():
-            try:
-                data = json.loads(self.path.read_text(encoding="utf-8"))
-            except Exception:
-                return
-            for field in ("energy", "food", "warmth", "ecological_debt", "relational_debt"):
-                if field in data:
-                    setattr(self, field, float(data[field]))
+        state = _read_state(self.path)
+        if state:
+            for name, value in state.items():
+                setattr(self, name, value)
+
+    def __enter__(self) -> "ResourceManager":
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self.autosave:
+            self.flush()
+
+    def flush(self) -> None:
+        """Persist pending changes deferred by ``autosave`` or a ``with`` block."""
+
+        if self._dirty:
+            self._save()
+            self._dirty = False
 
     # internal helpers -----------------------------------------------------
     def _clamp(self) -> None:
-        self.energy = max(0.0, min(100.0, self.energy))
-        self.food = max(0.0, min(100.0, self.food))
-        self.warmth = max(0.0, min(100.0, self.warmth))
-        self.ecological_debt = max(0.0, min(100.0, self.ecological_debt))
-        self.relational_debt = max(0.0, min(100.0, self.relational_debt))
+        # Inline comparisons avoid ten builtin calls per mutation; ``v <= 100``
+        # keeps ``min``'s handling of NaN (clamped to 100).
+        v = self.energy
+        self.energy = 0.0 if v < 0.0 else (v if v <= 100.0 else 100.0)
+        v = self.food
+        self.food = 0.0 if v < 0.0 else (v if v <= 100.0 else 100.0)
+        v = self.warmth
+        self.warmth = 0.0 if v < 0.0 else (v if v <= 100.0 else 100.0)
+        v = self.ecological_debt
+        self.ecological_debt = 0.0 if v < 0.0 else (v if v <= 100.0 else 100.0)
+        v = self.relational_debt
+        self.relational_debt = 0.0 if v < 0.0 else (v if v <= 100.0 else 100.0)
 
     def _save(self) -> None:
-        data = {
-            "energy": self.energy,
-            "food": self.food,
-            "warmth": self.warmth,
-            "ecological_debt": self.ecological_debt,
-            "relational_debt": self.relational_debt,
-        }
-        _atomic_write_text(self.path, json.dumps(data))
+        values = (
+            self.energy,
+            self.food,
+            self.warmth,
+            self.ecological_debt,
+            self.relational_debt,
+        )
+        if all(
+            type(value) is int or (type(value) is float and math.isfinite(value))
+            for value in values
+        ):
+            # Same text as ``json.dumps`` for plain finite numbers, minus the dict.
+            text = _STATE_TEMPLATE % values
+        else:
+            text = json.dumps(dict(zip(_STATE_FIELDS, values)))
+        atomic_write_bytes(self.path, text.encode("ascii"))
+        _LOADED_STATES.pop(self.path, None)
+
+    def _persist(self) -> None:
+        if self.autosave and not self._batch_depth:
+            self._save()
+        else:
+            self._dirty = True
 
     # mutation methods -----------------------------------------------------
     def consume_energy(self, amount: float) -> None:
         self.energy -= amount
         self._clamp()
-        self._save()
+        self._persist()
 
     def regenerate_energy(self, amount: float) -> None:
         self.energy += amount
         self._clamp()
-        self._save()
+        self._persist()
 
     def consume_food(self, amount: float) -> None:
         self.food -= amount
         self._clamp()
-        self._save()
+        self._persist()
 
     def add_food(self, amount: float) -> None:
         effective = amount * max(0.2, 1.0 - (self.ecological_debt / 150.0))
         self.food += effective
         self._clamp()
-        self._save()
+        self._persist()
 
     def metabolize(self, rate: float = 0.1) -> None:
         """Convert stored food into energy.
@@ -105,18 +190,18 @@ class ResourceManager:
         self.food -= rate * (1.0 + (0.35 * eco_penalty))
         self.energy += (rate * 2) * max(0.2, 1.0 - (0.5 * eco_penalty))
         self._clamp()
-        self._save()
+        self._persist()
 
     def cool_down(self, amount: float) -> None:
         self.warmth -= amount
         self._clamp()
-        self._save()
+        self._persist()
 
     def add_warmth(self, amount: float) -> None:
         effective = amount * max(0.25, 1.0 - (self.relational_debt / 140.0))
         self.warmth += effective
         self._clamp()
-        self._save()
+        self._persist()
 
     def apply_world_state(self, world_state: dict[str, object] | None) -> None:
         """Project world debts into local resources to model indirect mortality pressure."""
@@ -146,7 +231,7 @@ class ResourceManager:
         self.food -= (eco_norm + delayed_risk) * 0.9
         self.warmth -= (rel_norm * 1.0) + (delayed_risk * 0.4)
         self._clamp()
-        self._save()
+        self._persist()
 
     def update_from_environment(self, temp: float) -> None:
         """Adjust ``warmth`` based on the surrounding temperature.
@@ -189,20 +274,14 @@ class ResourceManager:
     # mood -----------------------------------------------------------------
     def mood(self) -> List[str]:
         """Return a list describing the mood derived from resources."""
-        moods: List[str] = []
-        if self.energy < self.energy_threshold:
-            moods.append("tired")
-        if self.food < self.food_threshold:
-            moods.append("angry")
-        if self.warmth < self.warmth_threshold:
-            moods.append("cold")
-        if self.relational_debt >= 55.0:
-            moods.append("tense")
-        if self.ecological_debt >= 60.0:
-            moods.append("strained")
-        if not moods:
-            moods.append("content")
-        return moods
+        mask = (
+            (self.energy < self.energy_threshold)
+            | (self.food < self.food_threshold) << 1
+            | (self.warmth < self.warmth_threshold) << 2
+            | (self.relational_debt >= 55.0) << 3
+            | (self.ecological_debt >= 60.0) << 4
+        )
+        return list(_MOOD_TABLE[mask])
 
     def viability_state(self) -> CapabilityStatus:
         if (
@@ -237,9 +316,10 @@ class ResourceManager:
         energy_cost, food_cost, warmth_cost = costs.get(capability, (0.3, 0.1, 0.0))
         if state == CapabilityStatus.FATIGUED:
             energy_cost *= 0.5
-        self.consume_energy(energy_cost)
-        self.consume_food(food_cost)
-        self.cool_down(warmth_cost)
+        with self:
+            self.consume_energy(energy_cost)
+            self.consume_food(food_cost)
+            self.cool_down(warmth_cost)
         return True, self.viability_state()
 
 
@@ -7,13 +7,16 @@ offset (``+00:00``). Compact timestamps used in filenames remain UTC
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from pathlib import Path
+import itertools
 import json
 import logging
 import os
-from typing import Any, Mapping
+import time
+from typing import Any, Mapping, TextIO
 
 from ..storage_retention import run_retention_service
 from ..storage import (
@@ -25,7 +28,8 @@ from ..storage import (
 )
 
 from ..psyche import Psyche
-from ..memory import add_episode, add_procedural_memory
+from ..memory import add_episode, add_procedural_memory, render_mood
+from ..io_utils import atomic_write_text
 from typing import Callable, Dict
 
 # Base directory for persistent files
@@ -101,9 +105,100 @@ def log_provider_event(
         _provider_logger.debug("provider_event_sqlite_persist_failed", exc_info=True)
 
 
-def _ensure_dir(path: Path) -> None:
-    """Ensure ``path``'s parent directory exists."""
-    path.parent.mkdir(parents=True, exist_ok=True)
+# Last ``(epoch second, ISO timestamp)`` pair, shared by every logger so that
+# records written within the same second reuse one formatted string.
+_LAST_TIMESTAMP: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as ``YYYY-mm-ddTHH:MM:SS+00:00``."""
+
+    global _LAST_TIMESTAMP
+    second = int(time.time())
+    cached = _LAST_TIMESTAMP
+    if cached[0] == second:
+        return cached[1]
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(second))
+    _LAST_TIMESTAMP = (second, stamp)
+    return stamp
+
+
+# ``O_DSYNC`` makes every ``write`` durable on its own, so the append logs
+# opened with it need no ``fsync`` afterwards.  Platforms without the flag
+# fall back to an explicit sync, data-only where ``fdatasync`` exists.
+_DSYNC_FLAG = getattr(os, "O_DSYNC", 0)
+_data_sync = getattr(os, "fdatasync", os.fsync)
+
+
+def _open_synced_log(path: Path, *, exclusive: bool = False) -> TextIO:
+    """Open ``path`` for appending, with synchronous data writes when supported.
+
+    With ``exclusive`` the file must not exist yet (:class:`FileExistsError`).
+    """
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | _DSYNC_FLAG
+    if exclusive:
+        flags |= os.O_EXCL
+    fd = os.open(path, flags, 0o644)
+    return os.fdopen(fd, "a", encoding="utf-8")
+
+
+def _sync_log(handle: TextIO) -> None:
+    """Push ``handle``'s buffer to disk, syncing unless it was opened with ``O_DSYNC``."""
+
+    handle.flush()
+    if not _DSYNC_FLAG:
+        _data_sync(handle.fileno())
+
+
+# ``os.writev`` hands a batch of lines to the kernel in one call, without
+# first joining them into a single string.  At most ``_IOV_MAX`` buffers are
+# passed per call: the platform limit, or the POSIX minimum
+# (``_XOPEN_IOV_MAX`` = 16) when it cannot be queried.
+_writev = getattr(os, "writev", None)
+
+
+def _iov_max() -> int:
+    try:
+        limit = os.sysconf("SC_IOV_MAX")
+    except (AttributeError, ValueError, OSError):
+        return 16
+    return limit if limit > 0 else 16
+
+
+_IOV_MAX = _iov_max()
+
+
+def _writev_all(
+    fd: int, buffers: list[bytes], writev: Callable[[int, list[bytes]], int]
+) -> None:
+    """Write every buffer to ``fd`` with ``writev``, resuming after short writes."""
+
+    start = 0
+    while start < len(buffers):
+        written = writev(fd, buffers[start : start + _IOV_MAX])
+        while written:
+            size = len(buffers[start])
+            if written < size:
+                buffers[start] = buffers[start][written:]
+                break
+            written -= size
+            start += 1
+
+
+def _write_batches(batches: tuple[tuple[TextIO, list[str]], ...]) -> None:
+    """Append each batch of lines to its log handle and sync it."""
+
+    writev = _writev
+    for handle, lines in batches:
+        if writev is None:
+            handle.write("".join(lines))
+        else:
+            handle.flush()
+            _writev_all(
+                handle.fileno(), [line.encode("utf-8") for line in lines], writev
+            )
+        _sync_log(handle)
 
 
 def _enforce_retention(root: Path) -> None:
@@ -127,62 +222,127 @@ class RunLogger:
     root:
         Directory in which log files are written. When omitted, it is resolved
         from the current ``SINGULAR_HOME`` value at construction time.
+    batch_size:
+        Number of run records buffered before the run log and event log are
+        written and synced together.  The default of ``1`` syncs every record,
+        which keeps the crash-recovery guarantee; larger values trade the last
+        few records on a crash for one ``fsync`` per batch.
+    batch_interval_ms:
+        Maximum age of a buffered batch; the next record logged after this
+        delay flushes the batch regardless of its size.
+    background_writes:
+        Hand flushed batches to a dedicated writer thread so that the
+        synchronous disk writes overlap with the caller's psyche and memory
+        updates.  Batches keep their order; :meth:`close` and durable records
+        wait for the writer, and a failed write is raised by the next flush
+        or by :meth:`close`, which then leaves the temporary log in place.
     """
 
     run_id: str
     root: Path | None = None
     psyche: Psyche = field(default_factory=Psyche.load_state)
     reputation_update_every: int = DEFAULT_REPUTATION_UPDATE_EVERY
+    batch_size: int = 1
+    batch_interval_ms: float = 50.0
+    background_writes: bool = False
 
     def __post_init__(self) -> None:
-        self.root = (
+        root = self.root = (
             Path(self.root)
             if self.root is not None
             else Path(os.environ.get("SINGULAR_HOME", ".")) / "runs"
         )
-        self.root.mkdir(parents=True, exist_ok=True)
+        root.mkdir(parents=True, exist_ok=True)
 
-        self.run_dir = self.root / self.run_id
+        self.run_dir = root / self.run_id
         self.run_dir.mkdir(parents=True, exist_ok=True)
         self._active_lock_path = self.run_dir / ".active.lock"
+        self._current_log_path = self.run_dir / ".current_log"
+        # A lock left behind by a previous logger means it never closed.
+        interrupted = self._active_lock_path.exists()
         self._active_lock_path.write_text(
             json.dumps(
                 {
                     "run_id": self.run_id,
-                    "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "started_at": _utc_timestamp(),
                 }
             ),
             encoding="utf-8",
         )
+        self._pending_records: list[str] = []
+        self._pending_events: list[str] = []
+        self._batch_deadline: float | None = None
+        self._writer = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="run-logger")
+            if self.background_writes
+            else None
+        )
+        # Batches handed to the writer thread and not yet checked, oldest first.
+        self._write_futures: deque[Future[None]] = deque()
         self.events_path = self.run_dir / "events.jsonl"
-        self._events_file = self.events_path.open("a", encoding="utf-8")
+        self._events_file = _open_synced_log(self.events_path)
         self.consciousness_path = self.run_dir / "consciousness.jsonl"
-        self._consciousness_file = self.consciousness_path.open("a", encoding="utf-8")
+        self._consciousness_file = _open_synced_log(self.consciousness_path)
         self.skill_reputation_path = self.run_dir / "skill_reputation.json"
         self._skill_telemetry: dict[str, dict[str, float | int]] = {}
         self._skill_reputation: dict[str, dict[str, float | int]] = {}
         self._load_skill_reputation()
-        self._storage = SQLiteStorage(StorageConfig(root=self.root.parent))
+        self._storage = SQLiteStorage(StorageConfig(root=root.parent))
         self._runs_repository = RunsRepository(self._storage)
         self._skill_scores_repository = SkillScoresRepository(self._storage)
 
-        # Resume from existing temporary file if present
-        tmp_pattern = f"{self.run_id}-*.jsonl.tmp"
-        existing = sorted(self.root.glob(tmp_pattern))
-        if existing:
-            self.tmp_path = existing[-1]
+        # Resume the temporary log of an interrupted run, if any
+        existing = self._interrupted_log(root) if interrupted else None
+        if existing is not None:
+            self.tmp_path = existing
             # derive final path and timestamp from tmp file name
             self.path = self.tmp_path.with_suffix("")
-            stem = self.path.name
             # stem is <id>-<timestamp>
-            self.timestamp = stem.split("-", 1)[1]
-            self._file = self.tmp_path.open("a", encoding="utf-8")
+            self.timestamp = self.path.stem[len(self.run_id) + 1 :]
+            self._file = _open_synced_log(self.tmp_path)
         else:
-            self.timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
-            self.path = self.root / f"{self.run_id}-{self.timestamp}.jsonl"
+            self._file = self._create_log(root)
+            atomic_write_text(self._current_log_path, self.tmp_path.name)
+
+    def _create_log(self, root: Path) -> TextIO:
+        """Open a fresh ``<id>-<timestamp>.jsonl.tmp`` log for this run in ``root``.
+
+        The timestamp is the compact UTC second; when another log of the
+        same run already claimed it, a counter is appended so that the name
+        stays a single sortable run of digits.
+        """
+
+        stamp = time.strftime("%Y%m%d%H%M%S", time.gmtime())
+        for attempt in itertools.count():
+            self.timestamp = f"{stamp}{attempt:02d}" if attempt else stamp
+            self.path = root / f"{self.run_id}-{self.timestamp}.jsonl"
             self.tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
-            _ensure_dir(self.tmp_path)
-            self._file = self.tmp_path.open("a", encoding="utf-8")
+            if self.path.exists():
+                continue
+            try:
+                return _open_synced_log(self.tmp_path, exclusive=True)
+            except FileExistsError:
+                continue
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _interrupted_log(self, root: Path) -> Path | None:
+        """Return the temporary log left open by an interrupted run.
+
+        The ``.current_log`` pointer names it directly; logs written before
+        the pointer existed are still found by globbing the runs directory
+        ``root``.
+        """
+
+        try:
+            name = self._current_log_path.read_text(encoding="utf-8").strip()
+        except OSError:
+            name = ""
+        if name:
+            candidate = root / name
+            if candidate.is_file():
+                return candidate
+        existing = sorted(root.glob(f"{self.run_id}-*.jsonl.tmp"))
+        return existing[-1] if existing else None
 
     def _load_skill_reputation(self) -> None:
         if not self.skill_reputation_path.exists():
@@ -293,7 +453,7 @@ class RunLogger:
 
         payload = {
             "version": USAGE_REPUTATION_SCHEMA_VERSION,
-            "updated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "updated_at": _utc_timestamp(),
             "skills": self._skill_reputation,
         }
         self.skill_reputation_path.write_text(json.dumps(payload), encoding="utf-8")
@@ -304,22 +464,89 @@ class RunLogger:
     def skill_reputation(self) -> dict[str, dict[str, float | int]]:
         return {name: dict(stats) for name, stats in self._skill_reputation.items()}
 
-    def _write_record(self, record: dict[str, Any]) -> None:
-        self._file.write(json.dumps(record) + "\n")
-        self._file.flush()
-        os.fsync(self._file.fileno())
-        self._runs_repository.add_event(self.run_id, record)
+    def _queue_line(self, pending: list[str], line: str, durable: bool) -> None:
+        pending.append(line)
+        now = time.monotonic()
+        if self._batch_deadline is None:
+            self._batch_deadline = now + self.batch_interval_ms / 1000.0
+        if (
+            durable
+            or len(pending) >= self.batch_size
+            or now >= self._batch_deadline
+        ):
+            self.flush()
+            if durable:
+                self._wait_for_writer()
+
+    def flush(self) -> None:
+        """Write and sync buffered run records and events."""
+
+        self._reap_writes(block=False)
+        handles: tuple[tuple[TextIO, list[str]], ...] = (
+            (self._file, self._pending_records),
+            (self._events_file, self._pending_events),
+        )
+        batches = tuple(
+            (handle, pending)
+            for handle, pending in handles
+            if pending and not handle.closed
+        )
+        self._pending_records = []
+        self._pending_events = []
+        self._batch_deadline = None
+        if not batches:
+            return
+        if self._writer is None:
+            _write_batches(batches)
+            return
+        self._write_futures.append(self._writer.submit(_write_batches, batches))
 
-    def _write_event(self, event_type: str, payload: dict[str, Any], ts: str) -> None:
-        event = {
-            "version": EVENT_SCHEMA_VERSION,
-            "event_type": event_type,
-            "ts": ts,
-            "payload": payload,
-        }
-        self._events_file.write(json.dumps(event) + "\n")
-        self._events_file.flush()
-        os.fsync(self._events_file.fileno())
+    def _reap_writes(self, *, block: bool) -> None:
+        """Forget finished background writes, raising the first that failed.
+
+        With ``block`` every submitted batch is waited for; the single writer
+        runs them in order, so failures surface in submission order.
+        """
+
+        futures = self._write_futures
+        while futures and (block or futures[0].done()):
+            error = futures.popleft().exception()
+            if error is not None:
+                raise error
+
+    def _wait_for_writer(self) -> None:
+        """Block until the writer thread has synced every submitted batch."""
+
+        self._reap_writes(block=True)
+
+    def _write_record(
+        self,
+        event_type: str,
+        record: dict[str, Any],
+        *,
+        durable: bool = False,
+        encoded: str | None = None,
+    ) -> str:
+        """Append ``record`` to the run log and wrap it as an ``event_type`` event.
+
+        The record is encoded once; the event line embeds that text as its
+        payload, and the text is returned so the episodic memory can reuse it.
+        Fixed-shape events pass ``encoded`` prebuilt from a template; it must
+        equal ``json.dumps(record, ensure_ascii=False)``.
+        """
+
+        if encoded is None:
+            encoded = json.dumps(record, ensure_ascii=False)
+        self._queue_line(self._pending_records, encoded + "\n", durable)
+        self._runs_repository.add_event(self.run_id, record)
+        event_line = (
+            f'{{"version": {EVENT_SCHEMA_VERSION}, '
+            f'"event_type": {json.dumps(event_type, ensure_ascii=False)}, '
+            f'"ts": {json.dumps(record["ts"], ensure_ascii=False)}, '
+            f'"payload": {encoded}}}\n'
+        )
+        self._queue_line(self._pending_events, event_line, durable)
+        return encoded
 
     def log_consciousness(
         self,
@@ -335,7 +562,7 @@ class RunLogger:
     ) -> None:
         """Record a reflection event in ``runs/<run_id>/consciousness.jsonl``."""
 
-        ts = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        ts = _utc_timestamp()
         record: dict[str, Any] = {
             "ts": ts,
             "event": "consciousness",
@@ -351,8 +578,7 @@ class RunLogger:
             "success": success,
         }
         self._consciousness_file.write(json.dumps(record) + "\n")
-        self._consciousness_file.flush()
-        os.fsync(self._consciousness_file.fileno())
+        _sync_log(self._consciousness_file)
 
     def log(
         self,
@@ -379,7 +605,7 @@ class RunLogger:
     ) -> None:
         """Append a mutation record to the log file."""
 
-        ts = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        ts = _utc_timestamp()
         record: dict[str, Any] = {
             "ts": ts,
             "skill": skill,
@@ -403,8 +629,7 @@ class RunLogger:
             "mutation_error_type": mutation_error_type,
             "mutation_error_message": mutation_error_message,
         }
-        self._write_record(record)
-        self._write_event("mutation", record, ts)
+        encoded = self._write_record("mutation", record)
         if usage_metrics:
             self._append_skill_telemetry(
                 skill=skill,
@@ -419,8 +644,16 @@ class RunLogger:
         self.psyche.process_run_record(record)
         mood = getattr(self.psyche, "last_mood", None)
         mood_val = getattr(mood, "value", mood)
+        if mood_val is not None:
+            mood_val = render_mood(mood_val, mood_styles)
+        # ``record`` has no ``event``/``mood`` keys, so the episode text is the
+        # record's text with those two keys prepended.
         add_episode(
-            {"event": "mutation", "mood": mood_val, **record}, mood_styles=mood_styles
+            {"event": "mutation", "mood": mood_val, **record},
+            encoded=(
+                f'{{"event": "mutation", '
+                f'"mood": {json.dumps(mood_val, ensure_ascii=False)}, {encoded[1:]}'
+            ),
         )
         add_procedural_memory(record)
 
@@ -437,7 +670,7 @@ class RunLogger:
         """Record life-loop phase timings for profiling and dashboard views."""
 
         record: dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "ts": _utc_timestamp(),
             "event": "life_loop_phase_metrics",
             "iteration": iteration,
             "phase_metrics": {
@@ -449,84 +682,100 @@ class RunLogger:
                 "async_distribution_note": async_distribution_note,
             },
         }
-        self._write_record(record)
-        self._write_event("life_loop_phase_metrics", record, record["ts"])
+        self._write_record("life_loop_phase_metrics", record)
 
     def log_death(self, reason: str, **info: Any) -> None:
         """Record a death event with optional additional information."""
 
         record: dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "ts": _utc_timestamp(),
             "event": "death",
             "reason": reason,
             **info,
         }
-        self._write_record(record)
-        self._write_event("death", record, record["ts"])
-        add_episode(record)
+        # Death ends the run, so it is synced at once whatever the batch size.
+        encoded = self._write_record("death", record, durable=True)
+        add_episode(record, encoded=encoded)
 
     def log_refusal(self, skill: str) -> None:
         """Record a refusal to mutate ``skill``."""
 
-        record: dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
-            "event": "refuse",
-            "skill": skill,
-        }
-        self._write_record(record)
-        self._write_event("refuse", record, record["ts"])
-        add_episode(record)
+        ts = _utc_timestamp()
+        record: dict[str, Any] = {"ts": ts, "event": "refuse", "skill": skill}
+        encoded = self._write_record(
+            "refuse",
+            record,
+            encoded=(
+                f'{{"ts": "{ts}", "event": "refuse", '
+                f'"skill": {json.dumps(skill, ensure_ascii=False)}}}'
+            ),
+        )
+        add_episode(record, encoded=encoded)
 
     def log_delay(self, skill: str, resume_at: float) -> None:
         """Record a procrastination event for ``skill``."""
 
+        ts = _utc_timestamp()
         record: dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "ts": ts,
             "event": "delay",
             "skill": skill,
             "resume_at": resume_at,
         }
-        self._write_record(record)
-        self._write_event("delay", record, record["ts"])
-        add_episode(record)
+        encoded = self._write_record(
+            "delay",
+            record,
+            encoded=(
+                f'{{"ts": "{ts}", "event": "delay", '
+                f'"skill": {json.dumps(skill, ensure_ascii=False)}, '
+                f'"resume_at": {json.dumps(resume_at)}}}'
+            ),
+        )
+        add_episode(record, encoded=encoded)
 
     def log_absurde(self, skill: str, diff: str) -> None:
         """Record an absurd mutation event."""
 
+        ts = _utc_timestamp()
         record: dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "ts": ts,
             "event": "absurde",
             "skill": skill,
             "diff": diff,
         }
-        self._write_record(record)
-        self._write_event("absurde", record, record["ts"])
-        add_episode(record)
+        encoded = self._write_record(
+            "absurde",
+            record,
+            encoded=(
+                f'{{"ts": "{ts}", "event": "absurde", '
+                f'"skill": {json.dumps(skill, ensure_ascii=False)}, '
+                f'"diff": {json.dumps(diff, ensure_ascii=False)}}}'
+            ),
+        )
+        add_episode(record, encoded=encoded)
 
     def log_interaction(self, event: str, **info: Any) -> None:
         """Record an explicit ecosystem interaction event."""
 
         record: dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "ts": _utc_timestamp(),
             "event": "interaction",
             "interaction": event,
             **info,
         }
-        self._write_record(record)
-        self._write_event("interaction", record, record["ts"])
-        add_episode(record)
+        encoded = self._write_record("interaction", record)
+        add_episode(record, encoded=encoded)
 
     def log_event(self, event: str, **info: Any) -> None:
         """Record a named run event without wrapping it as an interaction."""
 
         record: dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "ts": _utc_timestamp(),
             "event": event,
             **info,
         }
-        self._write_record(record)
-        self._write_event(event, record, record["ts"])
-        add_episode(record)
+        encoded = self._write_record(event, record)
+        add_episode(record, encoded=encoded)
 
     def log_test_coevolution(
         self,
@@ -550,7 +799,7 @@ class RunLogger:
         """Record co-evolution decisions for the living test pool."""
 
         record: dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "ts": _utc_timestamp(),
             "event": "test_coevolution",
             "skill": skill,
             "accepted": accepted,
@@ -568,30 +817,35 @@ class RunLogger:
             "tests_rejected": rejected_tests or [],
             "mutation_rejected_for_robustness": rejected_for_robustness,
         }
-        self._write_record(record)
-        self._write_event("test_coevolution", record, record["ts"])
-        add_episode(record)
+        encoded = self._write_record("test_coevolution", record)
+        add_episode(record, encoded=encoded)
 
     def close(self) -> None:
         """Flush and finalize the log files atomically."""
+        if self._writer is None:
+            self.flush()
+        else:
+            try:
+                self.flush()
+                self._wait_for_writer()
+            finally:
+                self._writer.shutdown(wait=True)
         if not self._consciousness_file.closed:
-            self._consciousness_file.flush()
-            os.fsync(self._consciousness_file.fileno())
+            _sync_log(self._consciousness_file)
             self._consciousness_file.close()
         if not self._events_file.closed:
-            self._events_file.flush()
-            os.fsync(self._events_file.fileno())
+            _sync_log(self._events_file)
             self._events_file.close()
         if not self._file.closed:
             self._maybe_update_skill_reputation(force=True)
-            self._file.flush()
-            os.fsync(self._file.fileno())
+            _sync_log(self._file)
             self._file.close()
             os.replace(self.tmp_path, self.path)
-            try:
-                self._active_lock_path.unlink()
-            except FileNotFoundError:
-                pass
+            for marker in (self._current_log_path, self._active_lock_path):
+                try:
+                    marker.unlink()
+                except FileNotFoundError:
+                    pass
             _enforce_retention(self.root)
 
     def __enter__(self) -> RunLogger:  # pragma: no cover - trivial
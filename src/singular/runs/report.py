@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections import Counter
 from pathlib import Path
 import json
-from typing import Any
+from typing import Any, Iterator
 
 from .logger import RUNS_DIR
 from ..governance.policy import load_runtime_policy
@@ -16,10 +16,24 @@ from ..storage import RunsRepository, SQLiteStorage, StorageConfig
 from ..sensors import compute_host_metrics_aggregates, summarize_environmental_impact
 
 
-def load_run_records(
+def _iter_jsonl(path: Path) -> Iterator[Any]:
+    """Yield every non-blank line of ``path`` parsed as JSON."""
+
+    with path.open("rb") as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_run_records(
     run_id: str, runs_dir: Path | str = RUNS_DIR
-) -> list[dict[str, Any]]:
-    """Load run records for ``run_id`` from JSONL log file."""
+) -> Iterator[dict[str, Any]]:
+    """Yield run records for ``run_id`` one at a time.
+
+    JSONL logs are streamed line by line, so only one parsed record is held
+    at a time.  :class:`FileNotFoundError` is raised on the first iteration
+    when no log exists for ``run_id``.
+    """
     runs_dir = Path(runs_dir)
     db_path = runs_dir.parent / "mem" / "singular.sqlite3"
     if db_path.exists():
@@ -27,39 +41,34 @@ def load_run_records(
             SQLiteStorage(StorageConfig(root=runs_dir.parent, db_path=db_path))
         ).list_events(run_id)
         if records:
-            return records
+            yield from records
+            return
     event_path = runs_dir / run_id / "events.jsonl"
-    records: list[dict[str, Any]] = []
     if event_path.exists():
-        with event_path.open(encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                event = json.loads(line)
-                payload = event.get("payload", {})
-                if isinstance(payload, dict):
-                    records.append(
-                        {
-                            **payload,
-                            "_event_type": event.get("event_type"),
-                            "_ts": event.get("ts"),
-                        }
-                    )
-        return records
+        for event in _iter_jsonl(event_path):
+            payload = event.get("payload", {})
+            if isinstance(payload, dict):
+                yield {
+                    **payload,
+                    "_event_type": event.get("event_type"),
+                    "_ts": event.get("ts"),
+                }
+        return
 
     pattern = f"{run_id}-*.jsonl"
-    files = sorted(runs_dir.glob(pattern))
-    if not files:
+    # Timestamped names sort chronologically; a single max() pass finds the
+    # latest without materialising and sorting the whole listing.
+    path = max(runs_dir.glob(pattern), default=None)
+    if path is None:
         raise FileNotFoundError(f"No log file found for id {run_id}")
-    path = files[-1]
-    with path.open(encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line:
-                continue
-            records.append(json.loads(line))
-    return records
+    yield from _iter_jsonl(path)
+
+
+def load_run_records(
+    run_id: str, runs_dir: Path | str = RUNS_DIR
+) -> list[dict[str, Any]]:
+    """Load run records for ``run_id`` from JSONL log file."""
+    return list(iter_run_records(run_id, runs_dir))
 
 
 def _build_report_payload(
@@ -74,28 +83,30 @@ def _build_report_payload(
     if not mutations:
         raise ValueError("no_mutations")
 
-    scores = [float(r.get("score_new", 0.0)) for r in mutations]
-    ops = [str(r.get("op", "?")) for r in mutations]
-    counter = Counter(ops)
-    first_base = float(mutations[0].get("score_base", scores[0]))
-    final_score = scores[-1]
-
-    health_scores = [
-        float(h["score"])
-        for r in mutations
-        for h in [r.get("health", {})]
-        if isinstance(h, dict) and isinstance(h.get("score"), (int, float))
-    ]
-
+    # One pass gathers the timeline, the score extremes, the operator
+    # histogram and the health series.
+    counter: Counter[str] = Counter()
+    health_scores: list[float] = []
     timeline: list[dict[str, Any]] = []
+    improvements = degradations = 0
+    best_score = final_score = 0.0
     for idx, mutation in enumerate(mutations, start=1):
-        score_base = float(mutation.get("score_base", mutation.get("score_new", 0.0)))
         score_new = float(mutation.get("score_new", 0.0))
+        score_base = float(mutation.get("score_base", mutation.get("score_new", 0.0)))
+        if idx == 1 or score_new < best_score:
+            best_score = score_new
+        final_score = score_new
+        counter[str(mutation.get("op", "?"))] += 1
+        health = mutation.get("health", {})
+        if isinstance(health, dict) and isinstance(health.get("score"), (int, float)):
+            health_scores.append(float(health["score"]))
         delta = round(score_new - score_base, 6)
         if delta < 0:
             verdict = "improvement"
+            improvements += 1
         elif delta > 0:
             verdict = "degradation"
+            degradations += 1
         else:
             verdict = "stable"
         timeline.append(
@@ -110,9 +121,7 @@ def _build_report_payload(
                 "decision_reason": mutation.get("decision_reason"),
             }
         )
-
-    improvements = sum(1 for entry in timeline if entry["verdict"] == "improvement")
-    degradations = sum(1 for entry in timeline if entry["verdict"] == "degradation")
+    first_base = float(mutations[0].get("score_base", timeline[0]["score_new"]))
 
     if final_score < first_base:
         final_verdict = "improvement"
@@ -164,9 +173,9 @@ def _build_report_payload(
             "mutations_count": len(mutations),
         },
         "summary": {
-            "best_score": min(scores),
+            "best_score": best_score,
             "final_score": final_score,
-            "generations": len(scores),
+            "generations": len(mutations),
             "operator_histogram": dict(sorted(counter.items())),
             "improvements": improvements,
             "degradations": degradations,
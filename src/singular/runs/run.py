@@ -4,16 +4,45 @@ from __future__ import annotations
 
 import ast
 import difflib
+import os
 import random
 
 from singular.beliefs.store import BeliefStore
 from singular.life.operators import const_tune, deadcode_elim, eq_rewrite_reduce_sum
-from singular.life.score import score
+from singular.life.score import complexity, score
 from graine.evolver.generate import propose_mutations
 
 from ..psyche import Psyche
 from ..memory import add_episode
 
+_BASE_CODE = (
+    "total = 0\n" "for i in range(1000):\n" "    total += i\n" "result = total\n"
+)
+# The base snippet never changes, so its complexity is counted once.
+_BASE_COMPLEXITY = complexity(ast.parse(_BASE_CODE))
+
+
+def _record_diff(base: str, mutated: str, improved: bool) -> str:
+    """Return the unified diff stored in a run record.
+
+    Discarded mutations keep an empty diff unless
+    ``SINGULAR_LOG_UNIMPROVED_DIFFS`` is set, sparing ``difflib`` on the
+    runs whose code is thrown away.
+    """
+
+    if mutated == base or not (
+        improved or os.environ.get("SINGULAR_LOG_UNIMPROVED_DIFFS")
+    ):
+        return ""
+    return "".join(
+        difflib.unified_diff(
+            base.splitlines(True),
+            mutated.splitlines(True),
+            fromfile="base",
+            tofile="mutated",
+        )
+    )
+
 
 def run(seed: int | None = None) -> str:
     """Generate a candidate mutation and return the winning code string.
@@ -30,7 +59,7 @@ def run(seed: int | None = None) -> str:
         Optional random seed for reproducibility.
     """
 
-    base = "total = 0\n" "for i in range(1000):\n" "    total += i\n" "result = total\n"
+    base = _BASE_CODE
 
     psyche = Psyche.load_state()
     freq = max(
@@ -58,27 +87,26 @@ def run(seed: int | None = None) -> str:
 
     mutated = ast.unparse(mutated_tree)
 
+    # The unparsed source is counted, not ``mutated_tree``: tuned constants
+    # may round-trip to a different node count.
+    mutated_complexity = (
+        _BASE_COMPLEXITY if mutated == base else complexity(ast.parse(mutated))
+    )
+
     alpha = 100.0
-    base_score, _ = score(base, runs=1, alpha=alpha)
-    mutated_score, _ = score(mutated, runs=1, alpha=alpha)
+    base_score, _ = score(base, runs=1, alpha=alpha, node_count=_BASE_COMPLEXITY)
+    mutated_score, _ = score(
+        mutated, runs=1, alpha=alpha, node_count=mutated_complexity
+    )
 
     # Derive runtime in milliseconds by subtracting the complexity penalty.
-    complexity_base = sum(1 for _ in ast.walk(ast.parse(base)))
-    ms_base = base_score - alpha * complexity_base
-    complexity_new = sum(1 for _ in ast.walk(ast.parse(mutated)))
-    ms_new = mutated_score - alpha * complexity_new
+    ms_base = base_score - alpha * _BASE_COMPLEXITY
+    ms_new = mutated_score - alpha * mutated_complexity
 
     record = {
         "skill": "demo",
         "op": op_name,
-        "diff": "".join(
-            difflib.unified_diff(
-                base.splitlines(True),
-                mutated.splitlines(True),
-                fromfile="base",
-                tofile="mutated",
-            )
-        ),
+        "diff": _record_diff(base, mutated, mutated_score < base_score),
         "ok": True,
         "ms_base": ms_base,
         "ms_new": ms_new,
@@ -12,6 +12,7 @@ from singular.memory import append_jsonl_line_safe, get_mem_dir
 
 _DEFAULT_RETENTION_SAMPLES = 2000
 _DEFAULT_WINDOWS = (5, 20, 60)
+_TAIL_CHUNK_BYTES = 4096
 _METRICS_KEYS = (
     "cpu_percent",
     "ram_used_percent",
@@ -127,6 +128,29 @@ def _trim_retention(*, path: Path, retention: int) -> None:
     path.write_text("\n".join(lines[-retention:]) + "\n", encoding="utf-8")
 
 
+def _read_tail_lines(path: Path, limit: int) -> list[str]:
+    """Return the last ``limit`` lines of ``path`` reading backwards by chunks.
+
+    I/O is bounded by the size of the requested tail rather than by the
+    length of the whole file.
+    """
+
+    with path.open("rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        data = b""
+        # ``limit`` lines need ``limit`` separators plus the one before them.
+        while position > 0 and data.count(b"\n") <= limit:
+            step = min(_TAIL_CHUNK_BYTES, position)
+            position -= step
+            handle.seek(position)
+            data = handle.read(step) + data
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    if position > 0:
+        # The first line may have been cut in the middle of a record.
+        lines = lines[1:]
+    return lines[-limit:]
+
+
 def load_host_metrics_samples(*, limit: int | None = None) -> list[dict[str, Any]]:
     """Load persisted host metrics samples."""
 
@@ -134,11 +158,12 @@ def load_host_metrics_samples(*, limit: int | None = None) -> list[dict[str, Any
     if not path.exists():
         return []
     try:
-        lines = path.read_text(encoding="utf-8").splitlines()
+        if limit is not None and limit > 0:
+            lines = _read_tail_lines(path, limit)
+        else:
+            lines = path.read_text(encoding="utf-8").splitlines()
     except OSError:
         return []
-    if limit is not None and limit > 0:
-        lines = lines[-limit:]
     samples: list[dict[str, Any]] = []
     for line in lines:
         line = line.strip()
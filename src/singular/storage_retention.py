@@ -12,6 +12,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+import heapq
 import json
 import os
 import shutil
@@ -144,6 +145,29 @@ def _is_active_run(runs_dir: Path, run_id: str) -> bool:
     return any(runs_dir.glob(f"{run_id}-*.jsonl.tmp"))
 
 
+def _prune_tmp_logs(runs_dir: Path, *, keep: int) -> None:
+    """Delete all but the ``keep`` most recent ``*.jsonl.tmp`` logs in ``runs_dir``.
+
+    One ``scandir`` pass stats each entry once, and only the surplus oldest
+    entries are selected instead of sorting the whole listing.
+    """
+
+    try:
+        with os.scandir(runs_dir) as entries:
+            tmps = [
+                (entry.stat().st_mtime_ns, entry.name, entry.path)
+                for entry in entries
+                if entry.name.endswith(".jsonl.tmp")
+            ]
+    except FileNotFoundError:
+        return
+    for _mtime, _name, stale in heapq.nsmallest(max(0, len(tmps) - keep), tmps):
+        try:
+            os.unlink(stale)
+        except FileNotFoundError:  # pragma: no cover - race condition
+            pass
+
+
 def _retention_log_path(runs_dir: Path) -> Path:
     base_dir = runs_dir.parent
     return base_dir / _RETENTION_LOG_RELATIVE_PATH
@@ -467,16 +491,7 @@ def run_retention_service(
 
     last_run_summary: Mapping[str, Any] | None = None
     if not dry_run:
-        tmps = sorted(
-            target_runs_dir.glob("*.jsonl.tmp"),
-            key=lambda p: (p.stat().st_mtime, p.name),
-            reverse=True,
-        )
-        for old in tmps[config.max_runs :]:
-            try:
-                old.unlink()
-            except FileNotFoundError:  # pragma: no cover - race condition
-                pass
+        _prune_tmp_logs(target_runs_dir, keep=config.max_runs)
         deleted_decisions = [
             decision
             for decision in report.decisions
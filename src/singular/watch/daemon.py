@@ -58,9 +58,14 @@ class WatchDaemon:
         if not base_dir.exists():
             return {"count": 0, "latest_mtime": None}
 
-        run_files = sorted(base_dir.rglob("*.jsonl"))
-        latest_mtime = max((entry.stat().st_mtime for entry in run_files), default=None)
-        return {"count": len(run_files), "latest_mtime": latest_mtime}
+        count = 0
+        latest_mtime: float | None = None
+        for entry in base_dir.rglob("*.jsonl"):
+            count += 1
+            mtime = entry.stat().st_mtime
+            if latest_mtime is None or mtime > latest_mtime:
+                latest_mtime = mtime
+        return {"count": count, "latest_mtime": latest_mtime}
 
     def _folder_snapshot(self) -> dict[str, Any]:
         watch_dir = self.config.watch_dir or Path(os.environ.get("SINGULAR_HOME", "."))
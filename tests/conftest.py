@@ -1,6 +1,9 @@
 import ast
 import builtins
+import json
 import os
+import random
+import shutil
 import sys
 from pathlib import Path
 
@@ -36,6 +39,21 @@ from singular.memory_layers.local_json import LocalJsonMemoryBackend  # noqa: E4
 from singular.memory_layers.service import MemoryLayerService  # noqa: E402
 
 
+@pytest.fixture(autouse=True)
+def _clean_singular_env(monkeypatch):
+    """Start every test without inherited Singular root or LLM settings."""
+
+    for var in ("SINGULAR_ROOT", "SINGULAR_HOME", "LLM_PROVIDER"):
+        monkeypatch.delenv(var, raising=False)
+
+
+@pytest.fixture
+def rng_seed0():
+    """Return a fresh ``random.Random`` seeded with ``0``."""
+
+    return random.Random(0)
+
+
 @pytest.fixture
 def local_sandbox(monkeypatch):
     """Emulate the trusted worker protocol without starting an OCI container."""
@@ -102,3 +120,37 @@ def temp_life(isolated_singular_home, temp_skills_dir, temp_checkpoint):
         "checkpoint_path": temp_checkpoint,
         "mem_dir": isolated_singular_home / "mem",
     }
+
+
+@pytest.fixture(scope="session")
+def _life_template(tmp_path_factory):
+    """Birth one CLI life per session, to be copied by :func:`life_root`."""
+
+    from singular.cli import main
+
+    root = tmp_path_factory.mktemp("life_template") / "world"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("SINGULAR_HOME", raising=False)
+        mp.delenv("SINGULAR_ROOT", raising=False)
+        main(["--root", str(root), "birth", "--name", "Vie Quest"])
+    return root
+
+
+@pytest.fixture
+def life_root(_life_template, tmp_path, monkeypatch):
+    """Return a private copy of the session life registry as a CLI ``--root``.
+
+    The registry stores absolute life paths, so the copy's registry is
+    rewritten to point at the copied lives.  Files are copied rather than
+    hard-linked because the CLI appends to JSONL memories in place.
+    """
+
+    root = tmp_path / "world"
+    shutil.copytree(_life_template, root)
+    registry = root / "lives" / "registry.json"
+    payload = json.loads(registry.read_text(encoding="utf-8"))
+    for life in payload["lives"].values():
+        life["path"] = str(root / Path(life["path"]).relative_to(_life_template))
+    registry.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    monkeypatch.setenv("SINGULAR_ROOT", str(root))
+    return root
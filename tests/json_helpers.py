@@ -0,0 +1,22 @@
+"""Small JSON readers shared by test assertions."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+
+def load_json(path: Path | str) -> Any:
+    """Parse the JSON document at ``path`` straight from its bytes."""
+
+    return json.loads(Path(path).read_bytes())
+
+
+def iter_jsonl(path: Path | str) -> Iterator[Any]:
+    """Yield each non-blank line of the JSONL file at ``path``, parsed."""
+
+    with open(path, "rb") as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
@@ -1,5 +1,6 @@
 from importlib.metadata import EntryPoint
 
+from singular import providers
 from singular.providers import load_llm_provider
 from tests.providers import ep_provider
 
@@ -16,6 +17,28 @@ def test_load_llm_provider_entry_point(monkeypatch):
         return [ep]
 
     monkeypatch.setattr("singular.providers.entry_points", fake_entry_points)
+    monkeypatch.setattr(providers, "_LLM_ENTRY_POINTS", None)
     func = load_llm_provider("ext")
     assert func is not None
     assert func("hello") == ep_provider.generate_reply("hello")
+
+
+def test_llm_entry_points_are_scanned_once(monkeypatch):
+    ep = EntryPoint(
+        name="ext",
+        value="tests.providers.ep_provider:generate_reply",
+        group="singular.llm",
+    )
+    scans = []
+
+    def fake_entry_points(*, group):
+        scans.append(group)
+        return [ep]
+
+    monkeypatch.setattr("singular.providers.entry_points", fake_entry_points)
+    monkeypatch.setattr(providers, "_LLM_ENTRY_POINTS", None)
+
+    assert providers._load_provider_contract("ext") is not None
+    assert providers._load_provider_contract("ext") is not None
+    assert providers._load_provider_contract("missing") is None
+    assert scans == ["singular.llm"]
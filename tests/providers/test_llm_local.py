@@ -68,3 +68,11 @@ def test_local_retry_bounded(monkeypatch):
         client.generate_reply("yo", timeout=0.1)
 
     assert attempts["count"] == 2
+
+
+def test_filter_matches_isprintable_semantics():
+    text = "ok\x00\t line\u200b\u2028 é\x7f\n"
+    expected = "".join(ch for ch in text if ch.isprintable())
+
+    assert llm_local._filter(text) == expected
+    assert llm_local._filter("plain text") == "plain text"
@@ -1,5 +1,6 @@
 import pytest
 
+from singular import providers
 from singular.providers import ProviderMisconfiguredError, _load_provider_contract
 
 
@@ -14,3 +15,42 @@ def test_load_provider_contract_raises_explicit_error_when_dependency_is_missing
 
     with pytest.raises(ProviderMisconfiguredError, match="missing dependency 'missing_dependency'"):
         _load_provider_contract("broken")
+
+
+def test_load_llm_provider_caches_named_lookups(monkeypatch):
+    monkeypatch.setattr(providers, "_LLM_PROVIDERS", {})
+    calls: list[str | None] = []
+
+    def fake_load_llm_client(name):
+        calls.append(name)
+        return providers.LLMProviderClient(name="fake", generate=lambda prompt: "ok")
+
+    monkeypatch.setattr(providers, "load_llm_client", fake_load_llm_client)
+    first = providers.load_llm_provider("fake")
+    second = providers.load_llm_provider("fake")
+    providers.load_llm_provider(None)
+    providers.load_llm_provider(None)
+    providers.load_llm_provider(" , ")
+    providers.load_llm_provider(" , ")
+
+    assert first is second
+    assert first("hi") == "ok"
+    assert calls == ["fake", None, None, " , ", " , "]
+
+
+def test_load_llm_provider_does_not_cache_missing_providers(monkeypatch):
+    monkeypatch.setattr(providers, "_LLM_PROVIDERS", {})
+    installed: list[str] = []
+
+    def fake_load_llm_client(name):
+        if name not in installed:
+            return None
+        return providers.LLMProviderClient(name=name, generate=lambda prompt: "ok")
+
+    monkeypatch.setattr(providers, "load_llm_client", fake_load_llm_client)
+    assert providers.load_llm_provider("late") is None
+    installed.append("late")
+    provider = providers.load_llm_provider("late")
+
+    assert provider is not None
+    assert provider("hi") == "ok"
@@ -211,3 +211,19 @@ def test_atomic_write_text_non_windows_permission_error_not_retried(
     assert attempts == 1
     assert delays == []
     assert json.loads(destination.read_text(encoding="utf-8")) == {"old": True}
+
+
+def test_atomic_write_bytes_replaces_and_keeps_original_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    destination = tmp_path / "nested" / "state.json"
+
+    io_utils.atomic_write_bytes(destination, b'{"v": 1}')
+    assert json.loads(destination.read_text(encoding="utf-8")) == {"v": 1}
+
+    monkeypatch.setattr(io_utils.os, "replace", failing_replace)
+    with pytest.raises(RuntimeError):
+        io_utils.atomic_write_bytes(destination, b'{"v": 2}')
+
+    assert json.loads(destination.read_text(encoding="utf-8")) == {"v": 1}
+    assert sorted(p.name for p in destination.parent.iterdir()) == ["state.json"]
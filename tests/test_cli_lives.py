@@ -6,14 +6,11 @@ import pytest
 
 from singular.cli import main
 from singular.lives import load_registry, resolve_life
-from singular.memory import read_episodes
+from singular.memory import iter_episodes, read_episodes
 
 
 def test_lives_management(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     root = tmp_path / "universe"
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
-    monkeypatch.delenv("LLM_PROVIDER", raising=False)
     monkeypatch.setattr(
         "singular.organisms.talk.load_llm_provider", lambda _name: None, raising=False
     )
@@ -41,10 +38,9 @@ def test_lives_management(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> No
 
     main(["--root", str(root), "talk", "--prompt", "bonjour"])
 
-    alpha_episodes = read_episodes(alpha_path / "mem" / "episodic.jsonl")
     assert any(
         episode.get("role") == "user" and episode.get("text") == "bonjour"
-        for episode in alpha_episodes
+        for episode in iter_episodes(alpha_path / "mem" / "episodic.jsonl")
     )
     beta_after = read_episodes(beta_path / "mem" / "episodic.jsonl")
     assert beta_before == beta_after
@@ -71,8 +67,6 @@ def test_ecosystem_run_accepts_multiple_lives(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     root = tmp_path / "ecosystem"
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
 
     main(["--root", str(root), "lives", "create", "--name", "Alpha"])
     alpha_slug = load_registry()["active"]
@@ -113,8 +107,6 @@ def test_lives_list_supports_json_format(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture[str]
 ) -> None:
     root = tmp_path / "universe"
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
 
     main(["--root", str(root), "lives", "create", "--name", "Alpha"])
     main(["--root", str(root), "lives", "create", "--name", "Beta"])
@@ -132,8 +124,6 @@ def test_status_supports_subcommand_format_and_verbose(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
     root = tmp_path / "status-root"
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
 
     main(["--root", str(root), "lives", "create", "--name", "Alpha"])
 
@@ -152,8 +142,6 @@ def test_status_supports_subcommand_format_and_verbose(
 
 def test_cli_loop_runs_startup_retention(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     root = tmp_path / "loop-root"
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
     main(["--root", str(root), "lives", "create", "--name", "Alpha"])
 
     called: dict[str, object] = {"retention": 0}
@@ -191,7 +179,6 @@ def test_cli_root_context_message_when_switching_registry_root(
     root_b = tmp_path / "root-b"
 
     monkeypatch.setenv("SINGULAR_ROOT", str(root_a))
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
 
     main(["--root", str(root_a), "lives", "list"])
     first_out = capsys.readouterr().out
@@ -210,8 +197,6 @@ def test_birth_alias_prints_registry_root_used(
     capsys: pytest.CaptureFixture[str],
 ) -> None:
     root = tmp_path / "registry-root"
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
 
     main(["--root", str(root), "birth", "--name", "Gamma"])
     out = capsys.readouterr().out
@@ -226,8 +211,6 @@ def test_birth_is_removed_when_alias_disabled(
 ) -> None:
     root = tmp_path / "registry-root"
     monkeypatch.setenv("SINGULAR_ENABLE_BIRTH_ALIAS", "0")
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
 
     with pytest.raises(SystemExit) as excinfo:
         main(["--root", str(root), "birth", "--name", "Gamma"])
@@ -261,8 +244,6 @@ def test_lives_create_prints_registry_root_used(
     capsys: pytest.CaptureFixture[str],
 ) -> None:
     root = tmp_path / "registry-root"
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
 
     main(["--root", str(root), "lives", "create", "--name", "Alpha"])
     out = capsys.readouterr().out
@@ -290,8 +271,6 @@ def test_lives_create_first_run_has_no_missing_registry_warning(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     root = tmp_path / "fresh-root"
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
     caplog.set_level(logging.WARNING, logger="singular.lives")
 
     main(["--root", str(root), "lives", "create", "--name", "Alpha"])
@@ -306,8 +285,6 @@ def test_lives_archive_memorial_clone_guided_commands(
     capsys: pytest.CaptureFixture[str],
 ) -> None:
     root = tmp_path / "guided"
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
 
     main(["--root", str(root), "lives", "create", "--name", "Alpha"])
     capsys.readouterr()
@@ -349,8 +326,6 @@ def test_lives_relations_commands_and_journal(
     capsys: pytest.CaptureFixture[str],
 ) -> None:
     root = tmp_path / "relations"
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
 
     main(["--root", str(root), "lives", "create", "--name", "Alpha"])
     main(["--root", str(root), "lives", "create", "--name", "Beta"])
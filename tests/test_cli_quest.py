@@ -6,6 +6,7 @@ import pytest
 from singular.cli import main
 from singular.lives import resolve_life
 from singular.memory import read_episodes, read_skills
+from tests.json_helpers import load_json
 
 
 def _write_spec(path: Path, name: str, examples: list[dict]) -> None:
@@ -15,11 +16,11 @@ def _write_spec(path: Path, name: str, examples: list[dict]) -> None:
         "examples": examples,
         "constraints": {"pure": True, "no_import": True, "time_ms_max": 1000},
     }
-    path.write_text(json.dumps(spec), encoding="utf-8")
+    path.write_bytes(json.dumps(spec).encode("utf-8"))
 
 
-def test_quest_success(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    root = tmp_path / "world"
+def test_quest_success(life_root: Path, tmp_path: Path) -> None:
+    root = life_root
     spec_path = tmp_path / "square.json"
     _write_spec(
         spec_path,
@@ -27,13 +28,6 @@ def test_quest_success(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
         [{"input": [2], "output": 4}, {"input": [3], "output": 9}],
     )
 
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-
-    main(["--root", str(root), "birth", "--name", "Vie Quest"])
-    life_path = resolve_life(None)
-    assert life_path is not None
-
     main(["--root", str(root), "quest", "create", str(spec_path)])
 
     life_path = resolve_life(None)
@@ -54,12 +48,12 @@ def test_quest_success(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     assert episodes[-1]["status"] == "success"
     assert episodes[-1]["skill"] == "square"
 
-    psyche = json.loads((life_path / "mem" / "psyche.json").read_text())
+    psyche = load_json(life_path / "mem" / "psyche.json")
     assert psyche["last_mood"] == "proud"
 
 
-def test_quest_failure(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    root = tmp_path / "world"
+def test_quest_failure(life_root: Path, tmp_path: Path) -> None:
+    root = life_root
     spec_path = tmp_path / "bad.json"
     _write_spec(
         spec_path,
@@ -67,10 +61,6 @@ def test_quest_failure(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
         [{"input": [2], "output": 4}, {"input": [2], "output": 5}],
     )
 
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-
-    main(["--root", str(root), "birth", "--name", "Vie Quest"])
     life_path = resolve_life(None)
     assert life_path is not None
 
@@ -84,7 +74,7 @@ def test_quest_failure(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     episodes = read_episodes(life_path / "mem" / "episodic.jsonl")
     assert episodes[-1]["status"] == "failure"
 
-    psyche = json.loads((life_path / "mem" / "psyche.json").read_text())
+    psyche = load_json(life_path / "mem" / "psyche.json")
     assert psyche["last_mood"] == "frustrated"
 
 
@@ -112,9 +102,9 @@ def test_quest_schema_prints_without_active_life(
 
 
 def test_quest_invalid_spec_does_not_create_files(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    life_root: Path, tmp_path: Path
 ) -> None:
-    root = tmp_path / "world"
+    root = life_root
     spec_path = tmp_path / "invalid.json"
     spec_path.write_text(
         json.dumps(
@@ -128,10 +118,6 @@ def test_quest_invalid_spec_does_not_create_files(
         encoding="utf-8",
     )
 
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-
-    main(["--root", str(root), "birth", "--name", "Vie Quest Invalid"])
     life_path = resolve_life(None)
     assert life_path is not None
     before = {path.relative_to(life_path) for path in life_path.rglob("*")}
@@ -151,21 +137,17 @@ def test_quest_invalid_spec_does_not_create_files(
     ],
 )
 def test_quest_reports_file_input_errors(
-    monkeypatch: pytest.MonkeyPatch,
+    life_root: Path,
     tmp_path: Path,
     capsys: pytest.CaptureFixture[str],
     filename: str,
     contents: str | None,
     message: str,
 ) -> None:
-    root = tmp_path / "world"
+    root = life_root
     path = tmp_path / filename
     if contents is not None:
         path.write_text(contents, encoding="utf-8")
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    main(["--root", str(root), "birth", "--name", "Input Errors"])
-    capsys.readouterr()
 
     assert main(["--root", str(root), "quest", "create", str(path)]) == 2
 
@@ -179,10 +161,11 @@ def test_quest_reports_file_input_errors(
 
 def test_quest_reports_unreadable_file(
     monkeypatch: pytest.MonkeyPatch,
+    life_root: Path,
     tmp_path: Path,
     capsys: pytest.CaptureFixture[str],
 ) -> None:
-    root = tmp_path / "world"
+    root = life_root
     path = tmp_path / "unreadable.json"
     path.write_text("{}", encoding="utf-8")
     original_read_text = Path.read_text
@@ -192,10 +175,6 @@ def test_quest_reports_unreadable_file(
             raise PermissionError("permission denied")
         return original_read_text(target, *args, **kwargs)
 
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    main(["--root", str(root), "birth", "--name", "Unreadable Input"])
-    capsys.readouterr()
     monkeypatch.setattr(Path, "read_text", deny_read)
 
     assert main(["--root", str(root), "quest", "create", str(path)]) == 2
@@ -1,11 +1,14 @@
 import ast
+import copy
 import random
 
 from singular.life.operators import const_tune
 
+_BASE_TREE = ast.parse("a = 5\nb = 30")
+
 
 def test_const_tune_adjusts_small_ints():
-    tree = ast.parse("a = 5\nb = 30")
+    tree = copy.deepcopy(_BASE_TREE)
     rng = random.Random(0)
     new_tree = const_tune.apply(tree, rng=rng, probability=1.0)
     code = ast.unparse(new_tree)
@@ -2,9 +2,11 @@ import asyncio
 import json
 from pathlib import Path
 from queue import Empty
+import sys
 import threading
 
 import pytest
+from fastapi import HTTPException
 from fastapi_stub import TestClient
 
 import singular.dashboard as dashboard_module
@@ -19,17 +21,55 @@ def _receive_with_timeout(ws: TestClient._WSConnection, timeout: float = 2.0) ->
         raise AssertionError("timed out waiting for websocket message") from exc
 
 
-def test_dashboard_endpoints(tmp_path: Path, monkeypatch) -> None:
-    runs_dir = tmp_path / "runs"
+@pytest.fixture(scope="module")
+def _shared_dashboard(tmp_path_factory):
+    """Build one dashboard app per module over a reusable runs/psyche pair.
+
+    ``create_app`` resolves its home, quests and retention paths from the
+    environment, so the app is built with both variables pointing at the
+    module's temporary directory.
+    """
+
+    home = tmp_path_factory.mktemp("shared_dashboard")
+    runs_dir = home / "runs"
     runs_dir.mkdir()
-    (runs_dir / "log.txt").write_text("hello")
-    psyche_file = tmp_path / "psyche.json"
-    data = {"mood": "happy"}
-    psyche_file.write_text(json.dumps(data))
+    psyche_file = home / "psyche.json"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SINGULAR_HOME", str(home))
+        mp.setenv("SINGULAR_ROOT", str(home))
+        app = create_app(runs_dir=runs_dir, psyche_file=psyche_file)
+    return app, runs_dir, psyche_file
 
-    monkeypatch.setenv("SINGULAR_HOME", str(tmp_path))
-    app = create_app(runs_dir=runs_dir, psyche_file=psyche_file)
-    client = TestClient(app)
+
+@pytest.fixture
+def dashboard_client(_shared_dashboard, monkeypatch):
+    """Return ``(client, runs_dir, psyche_file, set_files)`` for the shared app.
+
+    ``set_files(logs, psyche)`` replaces the run logs with ``logs`` and writes
+    ``psyche`` to the psyche file, removing it when ``psyche`` is ``None``.
+    """
+
+    app, runs_dir, psyche_file = _shared_dashboard
+    monkeypatch.setenv("SINGULAR_HOME", str(runs_dir.parent))
+    monkeypatch.setenv("SINGULAR_ROOT", str(runs_dir.parent))
+
+    def set_files(logs: dict[str, str], psyche: dict[str, object] | None) -> None:
+        for path in runs_dir.iterdir():
+            path.unlink()
+        for name, text in logs.items():
+            (runs_dir / name).write_text(text, encoding="utf-8")
+        if psyche is None:
+            psyche_file.unlink(missing_ok=True)
+        else:
+            psyche_file.write_text(json.dumps(psyche), encoding="utf-8")
+
+    return TestClient(app), runs_dir, psyche_file, set_files
+
+
+def test_dashboard_endpoints(dashboard_client) -> None:
+    client, _runs_dir, _psyche_file, set_files = dashboard_client
+    data = {"mood": "happy"}
+    set_files({"log.txt": "hello"}, data)
 
     assert client.get("/logs").json() == {"log.txt": "hello"}
     assert client.get("/psyche").json() == data
@@ -1894,30 +1934,29 @@ def test_lives_genealogy_life_filter_limits_active_relations(
     )
 
 
-def test_psyche_missing_returns_404(tmp_path: Path) -> None:
-    runs_dir = tmp_path / "runs"
-    runs_dir.mkdir()
-
-    app = create_app(runs_dir=runs_dir, psyche_file=tmp_path / "psyche.json")
-    client = TestClient(app)
+def test_psyche_missing_returns_404(dashboard_client) -> None:
+    client, _runs_dir, _psyche_file, set_files = dashboard_client
+    set_files({}, None)
 
-    response = client.get("/psyche")
-    assert response.status_code == 404
+    with pytest.raises(HTTPException) as exc_info:
+        client.app._routes["/psyche"]()
+    assert exc_info.value.status_code == 404
 
 
-def test_websocket_stream_incremental_events_and_growth_stability(tmp_path: Path) -> None:
-    runs_dir = tmp_path / "runs"
-    runs_dir.mkdir()
+def test_websocket_stream_incremental_events_and_growth_stability(
+    dashboard_client,
+) -> None:
+    client, runs_dir, _psyche_file, set_files = dashboard_client
     run_file = runs_dir / "run-live-20260511090000.jsonl.tmp"
-    run_file.write_text(
-        json.dumps({"ts": "2026-04-12T10:00:00", "event": "interaction"}) + "\n",
-        encoding="utf-8",
+    set_files(
+        {
+            run_file.name: json.dumps(
+                {"ts": "2026-04-12T10:00:00", "event": "interaction"}
+            )
+            + "\n"
+        },
+        {"mood": "happy"},
     )
-    psyche_file = tmp_path / "psyche.json"
-    psyche_file.write_text(json.dumps({"mood": "happy"}), encoding="utf-8")
-
-    app = create_app(runs_dir=runs_dir, psyche_file=psyche_file)
-    client = TestClient(app)
 
     with client.websocket_connect("/ws") as ws:
         first = _receive_with_timeout(ws)
@@ -2059,16 +2098,7 @@ def test_websocket_application_shutdown_closes_client_and_releases_slot(
 def test_run_requires_uvicorn(
     monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
 ) -> None:
-    import builtins
-
-    real_import = builtins.__import__
-
-    def fake_import(name: str, *args, **kwargs):
-        if name == "uvicorn":
-            raise ImportError("No module named 'uvicorn'")
-        return real_import(name, *args, **kwargs)
-
-    monkeypatch.setattr(builtins, "__import__", fake_import)
+    monkeypatch.setitem(sys.modules, "uvicorn", None)
 
     with pytest.raises(SystemExit):
         run()
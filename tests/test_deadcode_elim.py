@@ -1,10 +1,9 @@
 import ast
+import copy
 
 from singular.life.operators import deadcode_elim
 
-
-def test_deadcode_elim_removes_trivial_ifs():
-    source = """
+_SOURCE = """
 def f(x):
     if False:
         x += 1
@@ -20,7 +19,9 @@ def f(x):
         pass
     return x
 """
-    expected = """
+_BASE_TREE = ast.parse(_SOURCE)
+
+_EXPECTED_SOURCE = """
 def f(x):
     x += 2
     if not (x > 0):
@@ -29,8 +30,10 @@ def f(x):
         x += 3
     return x
 """
-    tree = ast.parse(source)
+_EXPECTED = ast.unparse(ast.parse(_EXPECTED_SOURCE))
+
+
+def test_deadcode_elim_removes_trivial_ifs():
+    tree = copy.deepcopy(_BASE_TREE)
     new_tree = deadcode_elim.apply(tree)
-    assert ast.dump(new_tree, include_attributes=False) == ast.dump(
-        ast.parse(expected), include_attributes=False
-    )
+    assert ast.unparse(new_tree) == _EXPECTED
@@ -1,13 +1,14 @@
 import ast
-import functools
-import random
 import json
 from pathlib import Path
 
+import pytest
+
 import singular.life.loop as life_loop
 from singular.life.loop import run
 from singular.life.death import DeathMonitor
 from singular.events import EventBus
+from tests.json_helpers import iter_jsonl, load_json
 
 
 class _StablePsyche:
@@ -17,68 +18,71 @@ class _StablePsyche:
     playfulness = 1.0
 
 
-def _inc_operator(tree: ast.AST, rng=None) -> ast.AST:
-    for node in ast.walk(tree):
+def _find_first_int(tree: ast.AST) -> ast.Constant | None:
+    stack = [tree]
+    while stack:
+        node = stack.pop()
         if isinstance(node, ast.Constant) and isinstance(node.value, int):
-            node.value += 1
-            break
+            return node
+        stack.extend(reversed(list(ast.iter_child_nodes(node))))
+    return None
+
+
+def _inc_operator(tree: ast.AST, rng=None) -> ast.AST:
+    node = _find_first_int(tree)
+    if node is not None:
+        node.value += 1
     return tree
 
 
 def _dec_operator(tree: ast.AST, rng=None) -> ast.AST:
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Constant) and isinstance(node.value, int):
-            node.value -= 1
-            break
+    node = _find_first_int(tree)
+    if node is not None:
+        node.value -= 1
     return tree
 
 
-def _setup(tmp_path: Path):
-    skills_dir = tmp_path / "skills"
-    skills_dir.mkdir()
-    skill = skills_dir / "foo.py"
-    skill.write_text("result = 1", encoding="utf-8")
-    checkpoint = tmp_path / "ckpt.json"
-    return skills_dir, checkpoint
-
+@pytest.fixture
+def skills_dir(tmp_path: Path) -> Path:
+    """Return ``tmp_path/skills`` holding the single ``foo.py`` skill."""
 
-def _patch_logger(monkeypatch, tmp_path: Path):
-    from singular.runs.logger import RunLogger as RL
+    skills = tmp_path / "skills"
+    skills.mkdir()
+    (skills / "foo.py").write_bytes(b"result = 1")
+    return skills
 
-    monkeypatch.setattr(
-        life_loop, "RunLogger", functools.partial(RL, root=tmp_path / "logs")
-    )
 
+@pytest.fixture
+def patched_memory(monkeypatch, tmp_path: Path) -> list[dict]:
+    """Collect the loop's episodes in memory instead of the episodic file."""
 
-def _patch_memory(monkeypatch, tmp_path: Path):
     import singular.runs.logger as logger_mod
-    import json
 
-    episodic = tmp_path / "mem" / "episodic.jsonl"
+    monkeypatch.setenv("SINGULAR_HOME", str(tmp_path))
+    episodes: list[dict] = []
 
-    def fake_add_episode(episode, path=episodic, **kwargs):
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(episode) + "\n")
+    def fake_add_episode(episode, path=None, **kwargs) -> None:
+        episodes.append(episode)
 
     monkeypatch.setattr(logger_mod, "add_episode", fake_add_episode)
     monkeypatch.setattr(life_loop, "update_score", lambda *a, **k: None)
     monkeypatch.setattr(
         life_loop.Psyche, "load_state", staticmethod(lambda: life_loop.Psyche())
     )
-    return episodic
+    return episodes
 
 
 def _read_log(tmp_path: Path):
-    logs = list((tmp_path / "logs").glob("loop-*.jsonl"))
-    assert logs
-    return [json.loads(line) for line in logs[0].read_text().splitlines()]
+    # run() roots its default logger at $SINGULAR_HOME/runs (see patched_memory).
+    log = next((tmp_path / "runs").glob("loop-*.jsonl"), None)
+    assert log is not None
+    return list(iter_jsonl(log))
 
 
-def test_death_by_age(tmp_path: Path, monkeypatch):
-    skills_dir, ckpt = _setup(tmp_path)
-    _patch_logger(monkeypatch, tmp_path)
-    episodic = _patch_memory(monkeypatch, tmp_path)
+def test_death_by_age(
+    tmp_path: Path, skills_dir: Path, patched_memory: list[dict], rng_seed0
+):
+    ckpt = tmp_path / "ckpt.json"
 
     monitor = DeathMonitor(max_age=2, max_failures=99, min_trait=0.0)
 
@@ -86,7 +90,7 @@ def test_death_by_age(tmp_path: Path, monkeypatch):
         skills_dir,
         ckpt,
         budget_seconds=10.0,
-        rng=random.Random(0),
+        rng=rng_seed0,
         run_id="loop",
         operators={"inc": _inc_operator},
         mortality=monitor,
@@ -95,8 +99,7 @@ def test_death_by_age(tmp_path: Path, monkeypatch):
     assert state.iteration >= 2
     log = _read_log(tmp_path)
     assert any(entry.get("event") == "death" for entry in log)
-    episodes = episodic.read_text().splitlines()
-    assert any(json.loads(line)["event"] == "death" for line in episodes)
+    assert any(ep["event"] == "death" for ep in patched_memory)
 
 
 def test_death_monitor_triggers_on_five_consecutive_failures():
@@ -192,10 +195,9 @@ def test_death_monitor_edge_conditions_unchanged():
     assert reason == "energy depleted"
 
 
-def test_death_by_failures(tmp_path: Path, monkeypatch):
-    skills_dir, ckpt = _setup(tmp_path)
-    _patch_logger(monkeypatch, tmp_path)
-    _patch_memory(monkeypatch, tmp_path)
+@pytest.mark.usefixtures("patched_memory")
+def test_death_by_failures(tmp_path: Path, skills_dir: Path, rng_seed0):
+    ckpt = tmp_path / "ckpt.json"
 
     monitor = DeathMonitor(max_age=99, max_failures=2)
 
@@ -203,7 +205,7 @@ def test_death_by_failures(tmp_path: Path, monkeypatch):
         skills_dir,
         ckpt,
         budget_seconds=1.0,
-        rng=random.Random(0),
+        rng=rng_seed0,
         run_id="loop",
         operators={"inc": _inc_operator},
         mortality=monitor,
@@ -214,10 +216,9 @@ def test_death_by_failures(tmp_path: Path, monkeypatch):
     assert any(entry.get("event") == "death" for entry in log)
 
 
-def test_death_by_traits(tmp_path: Path, monkeypatch):
-    skills_dir, ckpt = _setup(tmp_path)
-    _patch_logger(monkeypatch, tmp_path)
-    _patch_memory(monkeypatch, tmp_path)
+@pytest.mark.usefixtures("patched_memory")
+def test_death_by_traits(tmp_path: Path, skills_dir: Path, monkeypatch, rng_seed0):
+    ckpt = tmp_path / "ckpt.json"
 
     class LowPsyche:
         curiosity = 0.0
@@ -244,7 +245,7 @@ def test_death_by_traits(tmp_path: Path, monkeypatch):
         skills_dir,
         ckpt,
         budget_seconds=1.0,
-        rng=random.Random(0),
+        rng=rng_seed0,
         run_id="loop",
         operators={"inc": _inc_operator},
         mortality=monitor,
@@ -255,10 +256,11 @@ def test_death_by_traits(tmp_path: Path, monkeypatch):
     assert any(entry.get("event") == "death" for entry in log)
 
 
-def test_extinction_generates_terminal_artifacts_and_status(tmp_path: Path, monkeypatch):
-    skills_dir, ckpt = _setup(tmp_path)
-    _patch_logger(monkeypatch, tmp_path)
-    _patch_memory(monkeypatch, tmp_path)
+@pytest.mark.usefixtures("patched_memory")
+def test_extinction_generates_terminal_artifacts_and_status(
+    tmp_path: Path, skills_dir: Path, monkeypatch, rng_seed0
+):
+    ckpt = tmp_path / "ckpt.json"
 
     life_home = tmp_path / "life-home"
     (life_home / "mem").mkdir(parents=True, exist_ok=True)
@@ -294,27 +296,27 @@ def test_extinction_generates_terminal_artifacts_and_status(tmp_path: Path, monk
         skills_dir,
         ckpt,
         budget_seconds=10.0,
-        rng=random.Random(0),
+        rng=rng_seed0,
         run_id="loop",
         operators={"inc": _inc_operator},
         mortality=monitor,
         event_bus=bus,
     )
 
-    autopsy = json.loads((life_home / "mem" / "autopsy.json").read_text(encoding="utf-8"))
+    autopsy = load_json(life_home / "mem" / "autopsy.json")
     assert autopsy["technical_causes"]
     assert autopsy["behavioral_causes"]
 
-    biography = json.loads((life_home / "mem" / "biography.final.json").read_text(encoding="utf-8"))
+    biography = load_json(life_home / "mem" / "biography.final.json")
     assert biography["periods"]
     assert biography["turning_points"]
     assert biography["regrets_and_pride"]["regrets"]
     assert biography["regrets_and_pride"]["pride"]
 
-    stop_signal = json.loads((life_home / "mem" / "orchestrator.stop.json").read_text(encoding="utf-8"))
+    stop_signal = load_json(life_home / "mem" / "orchestrator.stop.json")
     assert stop_signal["stop"] is True
 
-    updated_registry = json.loads((registry_dir / "registry.json").read_text(encoding="utf-8"))
+    updated_registry = load_json(registry_dir / "registry.json")
     assert updated_registry["lives"]["life-a"]["status"] == "extinct"
 
     assert terminal_events
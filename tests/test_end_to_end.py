@@ -6,7 +6,7 @@ from singular.cli import main
 from singular.memory import read_episodes
 from singular.organisms.birth import birth
 from singular.organisms.talk import talk
-from singular.runs.run import run
+from singular.runs.run import _record_diff, run
 from singular.runs.synthesize import synthesize
 
 
@@ -40,8 +40,6 @@ def test_cli_user_journey_birth_talk_loop_lives_uninstall(monkeypatch, tmp_path)
     """Exercise the critical CLI journey expected by release gates."""
 
     root = tmp_path / "universe"
-    monkeypatch.delenv("SINGULAR_ROOT", raising=False)
-    monkeypatch.delenv("SINGULAR_HOME", raising=False)
     monkeypatch.setattr("singular.organisms.talk.load_llm_client", lambda _name: None)
 
     assert main(["--root", str(root), "birth", "--name", "Alpha"]) == 0
@@ -87,3 +85,15 @@ def test_cli_user_journey_birth_talk_loop_lives_uninstall(monkeypatch, tmp_path)
     assert (root / "lives").exists()
     assert not (root / "mem").exists()
     assert not (root / "runs").exists()
+
+
+def test_record_diff_skips_discarded_mutations(monkeypatch):
+    monkeypatch.delenv("SINGULAR_LOG_UNIMPROVED_DIFFS", raising=False)
+    base, mutated = "result = 1\n", "result = 2\n"
+
+    assert _record_diff(base, base, True) == ""
+    assert _record_diff(base, mutated, False) == ""
+    assert "+result = 2" in _record_diff(base, mutated, True)
+
+    monkeypatch.setenv("SINGULAR_LOG_UNIMPROVED_DIFFS", "1")
+    assert "-result = 1" in _record_diff(base, mutated, False)
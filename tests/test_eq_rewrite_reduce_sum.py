@@ -1,10 +1,9 @@
 import ast
+import copy
 
 from singular.life.operators import eq_rewrite_reduce_sum
 
-
-def test_reduce_sum_rewrites_loop():
-    source = """
+_SOURCE = """
 from typing import Iterable
 
 def f(arr: Iterable[int]):
@@ -13,15 +12,19 @@ def f(arr: Iterable[int]):
         total += x
     return total
 """
-    expected = """
+_BASE_TREE = ast.parse(_SOURCE)
+
+_EXPECTED_SOURCE = """
 from typing import Iterable
 
 def f(arr: Iterable[int]):
     total = sum(arr)
     return total
 """
-    tree = ast.parse(source)
+_EXPECTED = ast.unparse(ast.parse(_EXPECTED_SOURCE))
+
+
+def test_reduce_sum_rewrites_loop():
+    tree = copy.deepcopy(_BASE_TREE)
     new_tree = eq_rewrite_reduce_sum.apply(tree)
-    assert ast.dump(new_tree, include_attributes=False) == ast.dump(
-        ast.parse(expected), include_attributes=False
-    )
+    assert ast.unparse(new_tree) == _EXPECTED
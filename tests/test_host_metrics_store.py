@@ -6,6 +6,7 @@ from singular.sensors.host_metrics_store import (
     append_host_metrics_sample,
     compute_host_metrics_aggregates,
     host_metrics_file,
+    load_host_metrics_samples,
     summarize_environmental_impact,
 )
 
@@ -81,3 +82,19 @@ def test_host_metrics_store_accepts_metric_status_payload(tmp_path, monkeypatch)
     assert latest["metrics"]["cpu_percent"] == 42.0
     assert latest["metric_status"]["cpu_percent"]["status"] == "available"
     assert latest["collection_strategy"] == "partial_fallback"
+
+
+def test_load_host_metrics_samples_tail_reads_last_records(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("SINGULAR_HOME", str(tmp_path))
+    path = host_metrics_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    padding = "x" * 300
+    rows = [json.dumps({"idx": idx, "pad": padding}) for idx in range(100)]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    samples = load_host_metrics_samples(limit=25)
+
+    assert [sample["idx"] for sample in samples] == list(range(75, 100))
+    assert [sample["idx"] for sample in load_host_metrics_samples(limit=500)] == list(
+        range(100)
+    )
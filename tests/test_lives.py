@@ -8,6 +8,7 @@ import pytest
 
 from singular.lives import (
     LifeMetadata,
+    _slugify,
     ally_lives,
     bootstrap_life,
     clone_life,
@@ -17,6 +18,7 @@ from singular.lives import (
     reconcile_lives,
     resolve_life,
     rival_lives,
+    save_registry,
     set_proximity,
     set_life_status,
 )
@@ -216,6 +218,88 @@ def test_life_metadata_from_payload_raises_for_bad_required_types() -> None:
         )
 
 
+def test_resolve_life_by_display_name_prefers_first_registered(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("SINGULAR_ROOT", str(tmp_path))
+    registry_path = tmp_path / "lives" / "registry.json"
+    registry_path.parent.mkdir(parents=True, exist_ok=True)
+    created_at = "2026-01-01T00:00:00+00:00"
+    registry_path.write_text(
+        json.dumps(
+            {
+                "active": None,
+                "lives": {
+                    "first": {
+                        "name": "Twin",
+                        "slug": "first",
+                        "path": str(tmp_path / "first"),
+                        "created_at": created_at,
+                    },
+                    "second": {
+                        "name": "Twin",
+                        "slug": "second",
+                        "path": str(tmp_path / "second"),
+                        "created_at": created_at,
+                    },
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    assert resolve_life("Twin") == tmp_path / "first"
+    assert load_registry()["active"] == "first"
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Alpha", "alpha"),
+        ("  Hello,  World 42! ", "hello-world-42"),
+        ("---", "life"),
+        ("Été à Paris", "t-paris"),
+        ("Alpha × Beta", "alpha-beta"),
+    ],
+)
+def test_slugify_ascii_fast_path_matches_regex_semantics(
+    name: str, expected: str
+) -> None:
+    assert _slugify(name) == expected
+
+
+def test_save_registry_skips_rewrite_when_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("SINGULAR_ROOT", str(tmp_path))
+    meta = LifeMetadata(
+        name="Alpha",
+        slug="alpha",
+        path=tmp_path / "alpha",
+        created_at="2026-01-01T00:00:00+00:00",
+    )
+    registry_path = tmp_path / "lives" / "registry.json"
+
+    save_registry({"active": "alpha", "lives": {"alpha": meta}})
+    before = registry_path.stat().st_mtime_ns
+
+    writes: list[Path] = []
+    original_write_text = Path.write_text
+
+    def _tracking_write_text(self: Path, *args, **kwargs):
+        writes.append(self)
+        return original_write_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_text", _tracking_write_text)
+    save_registry({"active": "alpha", "lives": {"alpha": meta}})
+    assert writes == []
+    assert registry_path.stat().st_mtime_ns == before
+
+    save_registry({"active": None, "lives": {"alpha": meta}})
+    assert writes == [registry_path]
+    assert load_registry()["active"] is None
+
+
 def test_load_registry_skips_invalid_entries_with_logging(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
 ) -> None:
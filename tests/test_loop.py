@@ -102,10 +102,10 @@ def _inc_operator(tree: ast.AST, rng=None) -> ast.AST:
 
 
 def _read_result(path: Path) -> int:
-    return int(path.read_text(encoding="utf-8").split("=")[1])
+    return int(path.read_bytes().split(b"=")[1])
 
 
-def test_mutation_persistence(tmp_path: Path):
+def test_mutation_persistence(tmp_path: Path, rng_seed0):
     skills_dir = tmp_path / "skills"
     skills_dir.mkdir()
     skill = skills_dir / "foo.py"
@@ -117,29 +117,27 @@ def test_mutation_persistence(tmp_path: Path):
         checkpoint,
         budget_seconds=10.0,
         max_iterations=1,
-        rng=random.Random(0),
+        rng=rng_seed0,
         operators={"dec": _dec_operator},
     )
 
     assert _read_result(skill) < 1
-    state = json.loads(checkpoint.read_text(encoding="utf-8"))
-    assert state["iteration"] >= 1
+    assert load_checkpoint(checkpoint).iteration >= 1
 
 
-def test_resume_from_checkpoint(tmp_path: Path):
+def test_resume_from_checkpoint(tmp_path: Path, rng_seed0):
     skills_dir = tmp_path / "skills"
     skills_dir.mkdir()
     skill = skills_dir / "foo.py"
     skill.write_text("result = 1", encoding="utf-8")
     checkpoint = tmp_path / "ckpt.json"
-    rng = random.Random(0)
 
     run(
         skills_dir,
         checkpoint,
         budget_seconds=10.0,
         max_iterations=1,
-        rng=rng,
+        rng=rng_seed0,
         operators={"dec": _dec_operator},
     )
     first_val = _read_result(skill)
@@ -150,7 +148,7 @@ def test_resume_from_checkpoint(tmp_path: Path):
         checkpoint,
         budget_seconds=10.0,
         max_iterations=1,
-        rng=rng,
+        rng=rng_seed0,
         operators={"dec": _dec_operator},
     )
     second_val = _read_result(skill)
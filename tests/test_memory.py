@@ -8,12 +8,18 @@ from typing import Any
 
 from singular.memory import (
     add_episode,
+    add_episodes,
+    iter_episodes,
+    read_episodes,
+    read_psyche,
+    write_psyche,
     apply_skill_maintenance,
     controlled_delete_skill,
     restore_skill,
     temporarily_disable_skill,
     update_note,
     update_score,
+    update_scores,
     update_trait,
     record_skill_metric,
 )
@@ -98,6 +104,60 @@ def test_add_episode(tmp_path: Path) -> None:
     assert json.loads(lines[0]) == {"event": "test"}
 
 
+def test_add_episodes_appends_batch_in_order(tmp_path: Path) -> None:
+    episode_path = tmp_path / "mem" / "episodic.jsonl"
+    add_episode({"event": "first"}, path=episode_path)
+    add_episodes([{"event": "a"}, {"event": "b", "text": "é"}], path=episode_path)
+    add_episodes([], path=episode_path)
+
+    lines = episode_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["event"] for line in lines] == ["first", "a", "b"]
+    assert json.loads(lines[-1])["text"] == "é"
+
+
+def test_add_episodes_ingests_remaining_episodes_after_a_failure(
+    tmp_path: Path, monkeypatch
+) -> None:
+    ingested: list[str] = []
+
+    class FlakyService:
+        def ingest_episode(self, episode: dict[str, Any]) -> None:
+            if episode["event"] == "a":
+                raise RuntimeError("boom")
+            ingested.append(episode["event"])
+
+    monkeypatch.setattr(memory, "get_memory_layer_service", lambda root: FlakyService())
+    add_episodes(
+        [{"event": "a"}, {"event": "b"}, {"event": "c"}],
+        path=tmp_path / "mem" / "episodic.jsonl",
+    )
+
+    assert ingested == ["b", "c"]
+
+
+def test_iter_episodes_streams_lines_lazily(tmp_path: Path) -> None:
+    episode_path = tmp_path / "mem" / "episodic.jsonl"
+    episode_path.parent.mkdir(parents=True)
+    episode_path.write_text('{"event": "a"}\n\n{"event": "b"}\nnot json\n', encoding="utf-8")
+
+    episodes = iter_episodes(episode_path)
+    assert next(episodes) == {"event": "a"}
+    assert next(episodes) == {"event": "b"}
+    assert list(iter_episodes(tmp_path / "missing.jsonl")) == []
+    assert read_episodes(tmp_path / "missing.jsonl") == []
+
+
+def test_psyche_round_trip_and_missing_or_corrupt_files(tmp_path: Path) -> None:
+    path = tmp_path / "mem" / "psyche.json"
+    assert read_psyche(path) == {}
+
+    write_psyche({"curiosity": 0.7, "last_mood": "fière"}, path)
+    assert read_psyche(path) == {"curiosity": 0.7, "last_mood": "fière"}
+
+    path.write_text("{not json", encoding="utf-8")
+    assert read_psyche(path) == {}
+
+
 def test_add_episode_concurrent_threads(tmp_path: Path) -> None:
     episode_path = tmp_path / "mem" / "episodic.jsonl"
     total = 80
@@ -150,6 +210,17 @@ def test_update_trait_score_and_note(tmp_path: Path) -> None:
     }
 
 
+def test_update_scores_preserves_notes_in_one_write(tmp_path: Path) -> None:
+    skills_path = tmp_path / "mem" / "skills.json"
+    update_note("archery", "bullseye", path=skills_path)
+
+    update_scores({"archery": 3.0, "fencing": 0.0}, path=skills_path)
+    assert json.loads(skills_path.read_text(encoding="utf-8")) == {
+        "archery": {"note": "bullseye", "score": 3.0},
+        "fencing": {"score": 0.0},
+    }
+
+
 def test_birth_initializes_default_skills(tmp_path: Path) -> None:
     birth(home=tmp_path)
 
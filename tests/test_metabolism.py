@@ -1,8 +1,160 @@
+import json
+import os
+
+import pytest
+
+from singular import resource_manager
+from singular.io_utils import atomic_write_bytes
 from singular.resource_manager import ResourceManager
 
 
+def test_default_path_lives_under_singular_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("SINGULAR_HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path / "..")
+    rm = ResourceManager()
+    rm.metabolize()
+    assert rm.path == tmp_path / "resources.json"
+    assert rm.path.exists()
+
+
 def test_metabolize(tmp_path):
     rm = ResourceManager(energy=50.0, food=30.0, path=tmp_path / "resources.json")
     rm.metabolize(rate=5.0)
     assert rm.energy == 60.0
     assert rm.food == 25.0
+
+
+def test_autosave_disabled_defers_writes_until_flush(tmp_path):
+    path = tmp_path / "resources.json"
+    rm = ResourceManager(energy=50.0, food=30.0, path=path, autosave=False)
+    rm.metabolize(rate=5.0)
+    rm.consume_food(5.0)
+    assert not path.exists()
+
+    rm.flush()
+    assert json.loads(path.read_text(encoding="utf-8"))["food"] == 20.0
+
+
+def test_with_block_and_capability_cost_write_once(tmp_path, monkeypatch):
+    rm = ResourceManager(path=tmp_path / "resources.json")
+    saves = []
+    real_save = ResourceManager._save
+
+    def counting_save(self):
+        saves.append(1)
+        real_save(self)
+
+    monkeypatch.setattr(ResourceManager, "_save", counting_save)
+
+    with rm:
+        rm.consume_energy(1.0)
+        rm.add_food(2.0)
+        rm.cool_down(0.5)
+    assert len(saves) == 1
+
+    rm.apply_capability_cost("mutation")
+    assert len(saves) == 2
+    assert ResourceManager(path=tmp_path / "resources.json").energy == rm.energy
+
+
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        ({}, ["content"]),
+        ({"energy": 5.0}, ["tired"]),
+        ({"food": 5.0, "warmth": 5.0}, ["angry", "cold"]),
+        (
+            {
+                "energy": 5.0,
+                "food": 5.0,
+                "warmth": 5.0,
+                "relational_debt": 55.0,
+                "ecological_debt": 60.0,
+            },
+            ["tired", "angry", "cold", "tense", "strained"],
+        ),
+        ({"relational_debt": 70.0}, ["tense"]),
+    ],
+)
+def test_mood_reports_states_in_order(tmp_path, overrides, expected):
+    rm = ResourceManager(path=tmp_path / "resources.json", **overrides)
+    assert rm.mood() == expected
+
+
+@pytest.mark.parametrize("energy", [12.5, 0.1 + 0.2, 7, float("nan")])
+def test_save_matches_json_dumps(tmp_path, energy):
+    path = tmp_path / "resources.json"
+    rm = ResourceManager(path=path, ecological_debt=3.25)
+    rm.energy = energy
+    rm._save()
+
+    expected = {
+        "energy": energy,
+        "food": rm.food,
+        "warmth": rm.warmth,
+        "ecological_debt": 3.25,
+        "relational_debt": 0.0,
+    }
+    assert path.read_text(encoding="utf-8") == json.dumps(expected)
+
+
+def test_resource_manager_has_no_instance_dict(tmp_path):
+    rm = ResourceManager(path=tmp_path / "resources.json")
+    assert not hasattr(rm, "__dict__")
+
+
+def test_unchanged_resource_file_is_parsed_once(tmp_path, monkeypatch):
+    path = tmp_path / "resources.json"
+    ResourceManager(energy=42.0, path=path)._save()
+    loads = []
+    real_loads = json.loads
+    monkeypatch.setattr(
+        resource_manager.json,
+        "loads",
+        lambda text: (loads.append(1), real_loads(text))[1],
+    )
+
+    assert ResourceManager(path=path).energy == 42.0
+    assert ResourceManager(path=path).energy == 42.0
+    assert len(loads) == 1
+
+    path.write_text(json.dumps({"energy": 7.5}), encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    assert ResourceManager(path=path).energy == 7.5
+    assert len(loads) == 2
+
+
+def test_clamp_bounds_every_resource(tmp_path):
+    rm = ResourceManager(path=tmp_path / "resources.json", autosave=False)
+    rm.energy, rm.food, rm.warmth = -3.0, 140.0, float("nan")
+    rm.ecological_debt, rm.relational_debt = 42.5, -0.1
+    rm._clamp()
+    assert (rm.energy, rm.food, rm.warmth) == (0.0, 100.0, 100.0)
+    assert (rm.ecological_debt, rm.relational_debt) == (42.5, 0.0)
+
+
+def test_missing_or_corrupt_resource_file_keeps_defaults(tmp_path):
+    path = tmp_path / "resources.json"
+    assert ResourceManager(path=path).energy == 100.0
+    path.write_bytes(b"{not json")
+    assert ResourceManager(path=path).food == 50.0
+
+
+def test_corrupt_resource_field_raises(tmp_path):
+    path = tmp_path / "resources.json"
+    path.write_bytes(b'{"energy": "lots"}')
+    with pytest.raises(ValueError):
+        ResourceManager(path=path)
+
+
+def test_same_size_atomic_rewrite_is_reloaded(tmp_path):
+    path = tmp_path / "resources.json"
+    atomic_write_bytes(path, b'{"energy": 41.0}')
+    stat = path.stat()
+    assert ResourceManager(path=path).energy == 41.0
+
+    # Another process rewrites the file within the mtime granularity.
+    atomic_write_bytes(path, b'{"energy": 42.0}')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert path.stat().st_size == stat.st_size
+    assert ResourceManager(path=path).energy == 42.0
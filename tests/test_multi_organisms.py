@@ -19,7 +19,7 @@ def _dec_operator(tree: ast.AST, rng=None) -> ast.AST:
 
 
 def _read_result(path: Path) -> int:
-    return int(path.read_text(encoding="utf-8").split("=")[1])
+    return int(path.read_bytes().split(b"=")[1])
 
 
 def test_multi_organisms_independent(tmp_path: Path, monkeypatch):
@@ -27,3 +27,8 @@ def test_mutation_absurde(tmp_path):
     mutated_result = mutated_ns["add"](1, 2)
 
     assert mutated_result == original_result
+
+
+def test_mutation_absurde_adds_missing_trailing_newline():
+    assert mutation_absurde("x = 1") == "x = 1\n0  # mutation absurde\n"
+    assert mutation_absurde("x = 1\n") == "x = 1\n0  # mutation absurde\n"
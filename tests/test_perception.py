@@ -56,6 +56,35 @@ def test_weather_api_timeout(monkeypatch):
     assert "weather" not in signals
 
 
+def test_weather_api_response_is_cached_for_ttl(monkeypatch):
+    reset_perception_state()
+    monkeypatch.setenv("SINGULAR_WEATHER_API", "http://example.com")
+    monkeypatch.setenv("SINGULAR_WEATHER_TTL", "60")
+    calls = []
+
+    class FakeResponse:
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {"temp": 21.5}
+
+    def fake_get(url, timeout):
+        calls.append(url)
+        return FakeResponse()
+
+    monkeypatch.setitem(sys.modules, "requests", types.SimpleNamespace(get=fake_get))
+
+    first = capture_signals(publish_event=False)
+    second = capture_signals(publish_event=False)
+    monkeypatch.setenv("SINGULAR_WEATHER_TTL", "0")
+    capture_signals(publish_event=False)
+    reset_perception_state()
+
+    assert first["weather"] == second["weather"] == {"temp": 21.5}
+    assert len(calls) == 2
+
+
 def test_capture_signals_publishes_normalized_artifact_events(tmp_path):
     reset_perception_state()
     sandbox = tmp_path / "sandbox"
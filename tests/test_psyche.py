@@ -1,7 +1,10 @@
+import json
+import os
 from pathlib import Path
 
 import pytest
 
+import singular.psyche as psyche_mod
 from singular.psyche import Psyche, Mood, choose_action_from_psyche
 from singular.resource_manager import ResourceManager
 from singular.motivation import GoalPolicy, Objective
@@ -28,6 +31,44 @@ def test_feel_updates_traits_and_last_mood() -> None:
     assert 0.0 <= psyche.resilience <= 1.0
 
 
+@pytest.mark.parametrize("mood", list(Mood))
+def test_feel_applies_mood_effect_table_with_clamping(mood: Mood) -> None:
+    start = dict(curiosity=0.95, patience=0.05, playfulness=0.5, optimism=0.02, resilience=0.98)
+    psyche = Psyche(**start)
+    psyche.feel(mood)
+    for trait, value in start.items():
+        delta = Psyche._MOOD_EFFECTS[mood].get(trait, 0.0)
+        assert getattr(psyche, trait) == max(0.0, min(1.0, value + delta))
+
+
+def test_feel_clamps_nan_traits_and_weights_to_upper_bound() -> None:
+    psyche = Psyche(
+        curiosity=float("nan"),
+        objectives={"survie": Objective("survie", weight=float("nan"))},
+    )
+    psyche.feel(Mood.CURIOUS)
+    assert psyche.curiosity == 1.0
+    assert psyche.objectives["survie"].weight == 1.0
+
+
+def test_feel_treats_unknown_events_as_neutral() -> None:
+    psyche = Psyche(curiosity=0.3)
+    assert psyche.feel("not-a-mood") is Mood.NEUTRAL  # type: ignore[arg-type]
+    assert psyche.curiosity == 0.3
+    assert psyche.mood_history == ["neutral"]
+
+
+def test_feel_keeps_the_latest_256_moods_in_the_same_list() -> None:
+    psyche = Psyche()
+    history = psyche.mood_history
+    for index in range(300):
+        psyche.feel(Mood.PROUD if index % 2 else Mood.ANXIOUS)
+    assert psyche.mood_history is history
+    assert len(history) == 256
+    assert history[-1] == "proud"
+    assert history[0] == "anxious"
+
+
 def test_policies_and_lower_clamp() -> None:
     psyche = Psyche(
         curiosity=0.05,
@@ -52,6 +93,46 @@ def test_trait_based_policy_overrides() -> None:
     assert high_traits.mutation_policy() == "exploit"
 
 
+def test_policy_memo_tracks_mood_and_trait_changes() -> None:
+    psyche = Psyche()
+    assert psyche.interaction_policy() == "balanced"
+    cached = psyche._policy_cache
+    assert psyche.mutation_policy() == "default"
+    assert psyche._policy_cache is cached
+
+    psyche.feel(Mood.FRUSTRATED)
+    assert psyche._policy_cache is None
+    assert psyche.interaction_policy() == "retry"
+
+    psyche.optimism = 0.9
+    assert psyche.interaction_policy() == "engaging"
+    psyche.resilience = 0.1
+    assert psyche.mutation_policy() == "explore"
+
+
+def test_mood_tables_are_shared_read_only_class_constants() -> None:
+    first, second = Psyche(), Psyche()
+    assert first._MOOD_EFFECTS is second._MOOD_EFFECTS
+    assert first._INTERACTION_POLICIES is second._INTERACTION_POLICIES
+    assert first._MUTATION_POLICIES is second._MUTATION_POLICIES
+    assert first._MUTATION_RATES is second._MUTATION_RATES
+    assert first._RESOURCE_MOOD_MAP is second._RESOURCE_MOOD_MAP
+    assert first._SOCIAL_EVENT_DELTAS is second._SOCIAL_EVENT_DELTAS
+    assert "_MOOD_EFFECTS" not in repr(first)
+    assert "_SOCIAL_EVENT_DELTAS" not in repr(first)
+    with pytest.raises(TypeError):
+        first._MUTATION_POLICIES[Mood.NEUTRAL.ordinal] = "explore"  # type: ignore[index]
+
+
+def test_mood_ordinals_index_the_policy_tables() -> None:
+    assert [mood.ordinal for mood in Mood] == list(range(len(Mood)))
+    assert Mood("proud") is Mood.PROUD
+    assert len(Psyche._MOOD_DELTAS) == len(Mood)
+    assert Psyche._MUTATION_POLICIES[Mood.ANXIOUS.ordinal] == "analyze"
+    assert Psyche._MUTATION_RATES[Mood.CURIOUS.ordinal] == 1.0
+    assert Psyche._INTERACTION_POLICIES[Mood.LONELY.ordinal] == "balanced"
+
+
 def test_state_persistence(tmp_path: Path) -> None:
     path = tmp_path / "mem" / "psyche.json"
     psyche = Psyche(
@@ -74,6 +155,63 @@ def test_state_persistence(tmp_path: Path) -> None:
     assert loaded.last_mood == psyche.last_mood
 
 
+def test_process_run_records_feels_each_record_and_saves_once(monkeypatch) -> None:
+    saves: list[object] = []
+    monkeypatch.setattr(Psyche, "save_state", lambda self, path=None: saves.append(path))
+    psyche = Psyche()
+    psyche.process_run_records(
+        [{"improved": True}, {"ms_base": 1.0, "ms_new": 2.0}, {}]
+    )
+    assert psyche.mood_history == ["proud", "frustrated", "anxious"]
+    assert psyche.last_mood is Mood.ANXIOUS
+    assert saves == [None]
+
+
+def test_load_state_reuses_parse_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "mem" / "psyche.json"
+    Psyche(curiosity=0.2).save_state(path)
+    reads: list[Path] = []
+    real_read = psyche_mod.read_psyche
+
+    def counting_read(target):
+        reads.append(target)
+        return real_read(target)
+
+    monkeypatch.setattr(psyche_mod, "read_psyche", counting_read)
+
+    first = Psyche.load_state(path)
+    second = Psyche.load_state(path)
+    first.mood_history.append("proud")
+    assert second.mood_history == []
+    assert len(reads) == 1
+
+    Psyche(curiosity=0.9).save_state(path)
+    assert Psyche.load_state(path).curiosity == 0.9
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload["curiosity"] = 0.4
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert Psyche.load_state(path).curiosity == 0.4
+    assert len(reads) == 3
+
+
+def test_load_state_reloads_same_size_external_rewrite(tmp_path: Path) -> None:
+    path = tmp_path / "mem" / "psyche.json"
+    Psyche(curiosity=0.2).save_state(path)
+    assert Psyche.load_state(path).curiosity == 0.2
+    before = path.stat()
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload["curiosity"] = 0.3
+    psyche_mod.write_psyche(payload, path)
+    os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert path.stat().st_size == before.st_size
+
+    assert Psyche.load_state(path).curiosity == 0.3
+
+
 def test_resource_manager_influences_mood(tmp_path: Path) -> None:
     psyche = Psyche()
 
@@ -140,6 +278,34 @@ def test_weighted_axes_and_operator_bias() -> None:
     assert set(biases) == {"op_a", "op_b", "op_c"}
 
 
+def test_adjust_objectives_reads_updated_parent_and_clamps() -> None:
+    root_policy = GoalPolicy(besoin=1.0, priorite=1.0, urgence=1.0, alignement_valeurs=1.0)
+    child_policy = GoalPolicy(besoin=0.0, priorite=0.0, urgence=0.0, alignement_valeurs=0.0)
+    psyche = Psyche(
+        objectives={
+            "root": Objective("root", weight=0.95, policy=root_policy),
+            "child": Objective(
+                "child", weight=0.2, parent="root", horizon_ticks=40, policy=child_policy
+            ),
+        }
+    )
+    psyche.adjust_objectives()
+    assert psyche.objectives["root"].weight == 1.0
+    assert psyche.objectives["child"].weight == pytest.approx(0.2 - 0.05 + 0.1 - 0.1)
+
+
+@pytest.mark.parametrize(("mood", "reward"), [(Mood.PLEASURE, 0.1), (Mood.PAIN, -0.1)])
+def test_pleasure_and_pain_reward_every_objective(mood: Mood, reward: float) -> None:
+    psyche = Psyche(
+        objectives={
+            "a": Objective("a", weight=0.5),
+            "b": Objective("b", weight=0.5),
+        }
+    )
+    psyche.feel(mood)
+    assert [obj.reward for obj in psyche.objectives.values()] == [reward, reward]
+
+
 def test_social_interaction_triggers_and_influence() -> None:
     psyche = Psyche(optimism=0.6, resilience=0.6, patience=0.6, playfulness=0.5)
 
@@ -240,3 +406,47 @@ def test_choose_action_from_psyche_uses_objectives_and_environment() -> None:
 
     assert decision.action == "forage"
     assert "scarcity" in decision.reason
+
+
+def test_psyche_has_no_instance_dict():
+    psyche = Psyche()
+    assert not hasattr(psyche, "__dict__")
+    assert psyche.last_mood is None
+
+
+class _FixedDraws:
+    def __init__(self, *draws: float) -> None:
+        self.draws = list(draws)
+
+    def random(self) -> float:
+        return self.draws.pop(0)
+
+    def choice(self, options):
+        return options[0]
+
+
+@pytest.mark.parametrize(
+    ("draw", "expected"),
+    [
+        (0.29, Psyche.Decision.REFUSE),
+        (0.305, Psyche.Decision.CURIOUS),
+        # Past base + (1 - base) * curiosity * 0.01 = 0.3063.
+        (0.308, Psyche.Decision.ACCEPT),
+        (0.32, Psyche.Decision.ACCEPT),
+    ],
+)
+def test_irrational_decision_uses_a_single_draw(draw: float, expected) -> None:
+    psyche = Psyche(curiosity=1.0)
+    psyche.feel(Mood.FRUSTRATED)
+    rng = _FixedDraws(draw)
+    assert psyche.irrational_decision(rng) is expected  # type: ignore[arg-type]
+    assert rng.draws == []
+
+
+def test_irrational_and_modulation_tables_are_class_constants() -> None:
+    first, second = Psyche(), Psyche()
+    assert first._IRRATIONAL_OUTCOMES is second._IRRATIONAL_OUTCOMES
+    assert first._IRRATIONAL_OUTCOMES == (Psyche.Decision.REFUSE, Psyche.Decision.DELAY)
+    first.feel(Mood.FATIGUE)
+    assert first.goal_modulation_profile() == 0.88
+    assert second.goal_modulation_profile() == 1.0
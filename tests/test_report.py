@@ -599,3 +599,66 @@ def test_report_works_when_memory_artifacts_are_absent(monkeypatch, tmp_path, ca
     assert "Run run-no-memory-artifacts" in out
     assert "Verdict de vie: not_alive_yet" in out
     assert "No skills recorded." in out
+
+
+def test_load_run_records_skips_blank_lines(tmp_path):
+    runs = tmp_path / "runs"
+    log = _write_mutation_run(
+        tmp_path,
+        "run1",
+        [
+            {"event_type": "mutation", "ts": "t1", "payload": {"op": "a"}},
+            {"event_type": "mutation", "ts": "t2", "payload": "not-a-record"},
+        ],
+    )
+    with log.open("a", encoding="utf-8") as fh:
+        fh.write("\n   \n")
+        fh.write(json.dumps({"event_type": "death", "ts": "t3", "payload": {"é": 1}}))
+
+    records = report_mod.load_run_records("run1", runs)
+    assert records == [
+        {"op": "a", "_event_type": "mutation", "_ts": "t1"},
+        {"é": 1, "_event_type": "death", "_ts": "t3"},
+    ]
+
+    (runs / "legacy-20260101000000.jsonl").write_text(
+        '{"op": "x"}\n\n{"op": "y"}\n', encoding="utf-8"
+    )
+    assert report_mod.load_run_records("legacy", runs) == [{"op": "x"}, {"op": "y"}]
+
+
+def test_iter_run_records_streams_lazily(tmp_path):
+    runs = tmp_path / "runs"
+    runs.mkdir()
+    (runs / "legacy-20260101000000.jsonl").write_text(
+        '{"op": "x"}\n{truncated', encoding="utf-8"
+    )
+
+    records = report_mod.iter_run_records("legacy", runs)
+    assert next(records) == {"op": "x"}
+    with pytest.raises(json.JSONDecodeError):
+        next(records)
+
+    missing = report_mod.iter_run_records("missing", runs)
+    with pytest.raises(FileNotFoundError):
+        next(missing)
+
+
+def test_report_summary_tracks_best_final_and_histogram(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    records = [
+        {"op": "mutate", "score_base": 2.0, "score_new": 1.5, "health": {"score": 60}},
+        {"op": "splice", "score_base": 1.5, "score_new": 0.9},
+        {"op": "mutate", "score_base": 0.9, "score_new": 1.1, "health": {"score": 70}},
+    ]
+
+    payload = report_mod._build_report_payload("run", records, skills_path=None)
+
+    assert payload["summary"]["best_score"] == 0.9
+    assert payload["summary"]["final_score"] == 1.1
+    assert payload["summary"]["generations"] == 3
+    assert payload["summary"]["operator_histogram"] == {"mutate": 2, "splice": 1}
+    assert payload["summary"]["improvements"] == 2
+    assert payload["summary"]["degradations"] == 1
+    assert payload["health"]["score"] == 70
+    assert payload["verdict"] == "improvement"
@@ -2,6 +2,7 @@ from pathlib import Path
 
 import ast
 import json
+import random
 import pytest
 
 from singular.organisms.spawn import spawn
@@ -13,6 +14,8 @@ from singular.life.reproduction import (
     authorize_reproduction_write,
     decide_reproduction,
     crossover,
+    inherit_psyche,
+    _bounded_numeric_inheritance,
 )
 from singular.social.graph import SocialGraph
 
@@ -60,6 +63,48 @@ def test_reproduction(tmp_path: Path):
     assert state["mood"] in {"happy", "sad"}
 
 
+def test_inherit_psyche_draws_once_per_key_in_sorted_order():
+    psyche_a = {"curiosity": 0.2, "mood": "calm", "style": "terse", "only_a": "x"}
+    psyche_b = {"curiosity": 0.8, "mood": "eager", "style": "verbose", "only_b": None}
+    policy = ReproductionVariationPolicy(mutation_intensity=0.5)
+
+    child = inherit_psyche(psyche_a, psyche_b, rng=random.Random(3), policy=policy)
+
+    reference_rng = random.Random(3)
+    expected = {
+        "curiosity": _bounded_numeric_inheritance(
+            0.2,
+            0.8,
+            rng=reference_rng,
+            intensity=0.5,
+            low=policy.numeric_min,
+            high=policy.numeric_max,
+        ),
+        "mood": reference_rng.choice(["calm", "eager"]),
+        "only_a": reference_rng.choice(["x"]),
+        "style": reference_rng.choice(["terse", "verbose"]),
+    }
+    assert child == expected
+    assert list(child) == ["curiosity", "mood", "only_a", "style"]
+
+
+def test_inherit_psyche_numeric_traits_match_bounded_inheritance():
+    psyche_a = {"curiosity": 0.1, "energy": 0.9, "optimism": 1}
+    psyche_b = {"curiosity": 0.7, "energy": 0.2, "optimism": 0}
+    policy = ReproductionVariationPolicy(mutation_intensity=0.8, numeric_max=0.6)
+
+    child = inherit_psyche(psyche_a, psyche_b, rng=random.Random(11), policy=policy)
+
+    reference_rng = random.Random(11)
+    expected = {}
+    for key in sorted(psyche_a):
+        val_a, val_b = float(psyche_a[key]), float(psyche_b[key])
+        amplitude = abs(val_a - val_b) * 0.8
+        mutated = (val_a + val_b) / 2 + reference_rng.uniform(-amplitude, amplitude)
+        expected[key] = max(policy.numeric_min, min(0.6, mutated))
+    assert child == expected
+
+
 def test_reproduction_inherits_partial_memory(tmp_path: Path):
     parent_a = tmp_path / "parent_a"
     parent_b = tmp_path / "parent_b"
@@ -1,8 +1,11 @@
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 import warnings
 
+import pytest
+
 from singular.runs import RunLogger
 from singular.runs.explain import summarize_mutation
 
@@ -107,6 +110,56 @@ def test_resume_after_crash(tmp_path: Path) -> None:
     assert [r["skill"] for r in records] == ["a", "b"]
 
 
+def test_resume_follows_current_log_pointer(tmp_path: Path) -> None:
+    logger1 = RunLogger("run", root=tmp_path)
+    logger1.log("a", "op", "diff", True, 1.0, 2.0, 0.1, 0.2)
+    logger1._file.close()
+    pointer = tmp_path / "run" / ".current_log"
+    assert pointer.read_text(encoding="utf-8") == logger1.tmp_path.name
+    orphan = tmp_path / "run-99991231235959.jsonl.tmp"
+    orphan.write_text("", encoding="utf-8")
+
+    logger2 = RunLogger("run", root=tmp_path)
+    assert logger2.tmp_path == logger1.tmp_path
+    logger2.close()
+
+    assert not pointer.exists()
+    assert orphan.exists()
+
+
+def test_clean_start_does_not_resume_leftover_tmp(tmp_path: Path) -> None:
+    leftover = tmp_path / "run-20000101000000.jsonl.tmp"
+    leftover.write_text("", encoding="utf-8")
+
+    logger = RunLogger("run", root=tmp_path)
+
+    assert logger.tmp_path != leftover
+    logger.close()
+
+
+def test_loggers_started_in_the_same_second_get_distinct_logs(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import singular.runs.logger as logger_mod
+
+    frozen = logger_mod.time.gmtime(1_700_000_000)
+    monkeypatch.setattr(logger_mod.time, "gmtime", lambda *_: frozen)
+
+    first = RunLogger("same", root=tmp_path)
+    first.log("a", "op", "diff", True, 1.0, 2.0, 0.1, 0.2)
+    first.close()
+    second = RunLogger("same", root=tmp_path)
+    second.close()
+
+    assert first.timestamp == "20231114221320"
+    assert second.timestamp == "2023111422132001"
+    assert first.path.read_text(encoding="utf-8")
+    assert sorted(p.name for p in tmp_path.glob("same-*.jsonl")) == [
+        "same-20231114221320.jsonl",
+        "same-2023111422132001.jsonl",
+    ]
+
+
 def test_log_test_coevolution(tmp_path: Path) -> None:
     logger = RunLogger("coevo", root=tmp_path)
     logger.log_test_coevolution(
@@ -274,3 +327,235 @@ def test_run_logger_persists_run_and_skill_reputation_to_sqlite(tmp_path: Path)
     storage = SQLiteStorage(StorageConfig(root=tmp_path))
     assert RunsRepository(storage).list_events("sqlite")[0]["skill"] == "skill_sql"
     assert SkillScoresRepository(storage).get("skill_sql")["use_count"] == 1
+
+
+def test_batched_records_are_synced_together(tmp_path: Path, monkeypatch) -> None:
+    import singular.runs.logger as logger_mod
+
+    syncs: list[object] = []
+    real_sync = logger_mod._sync_log
+    monkeypatch.setattr(
+        logger_mod, "_sync_log", lambda handle: (syncs.append(handle), real_sync(handle))
+    )
+    logger = RunLogger("batch", root=tmp_path, batch_size=3, batch_interval_ms=60_000)
+    logger.log_refusal("a")
+    logger.log_refusal("b")
+    assert syncs == []
+    assert logger.tmp_path.read_text(encoding="utf-8") == ""
+
+    logger.log_refusal("c")
+    assert len(syncs) == 2
+    assert set(map(id, syncs)) == {id(logger._file), id(logger._events_file)}
+    assert len(logger.tmp_path.read_text(encoding="utf-8").splitlines()) == 3
+
+    logger.log_refusal("d")
+    logger.log_death("old age")
+    assert len(logger.tmp_path.read_text(encoding="utf-8").splitlines()) == 5
+    logger.close()
+    assert logger.path.read_text(encoding="utf-8").count("\n") == 5
+
+    events = (tmp_path / "batch" / "events.jsonl").read_text(encoding="utf-8")
+    assert [json.loads(line)["event_type"] for line in events.splitlines()] == [
+        "refuse",
+        "refuse",
+        "refuse",
+        "refuse",
+        "death",
+    ]
+
+
+def test_background_writes_keep_order_on_the_writer_thread(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import threading
+
+    import singular.runs.logger as logger_mod
+
+    threads: set[str] = set()
+    real_write = logger_mod._write_batches
+
+    def recording_write(batches):
+        threads.add(threading.current_thread().name)
+        real_write(batches)
+
+    monkeypatch.setattr(logger_mod, "_write_batches", recording_write)
+    logger = RunLogger("bg", root=tmp_path, background_writes=True)
+    for reason in ("a", "b", "c"):
+        logger.log_refusal(reason)
+    logger.log_death("old age")
+    assert len(logger.tmp_path.read_text(encoding="utf-8").splitlines()) == 4
+    logger.close()
+
+    assert threads and all(name.startswith("run-logger") for name in threads)
+    lines = logger.path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["skill"] for line in lines[:3]] == ["a", "b", "c"]
+    assert json.loads(lines[3])["event"] == "death"
+
+
+def test_background_write_failure_of_a_queued_batch_is_raised(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import threading
+
+    import singular.runs.logger as logger_mod
+
+    release = threading.Event()
+    calls = {"n": 0}
+    real_write = logger_mod._write_batches
+
+    def failing_first_write(batches):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            release.wait(timeout=5)
+            raise OSError("disk full")
+        real_write(batches)
+
+    monkeypatch.setattr(logger_mod, "_write_batches", failing_first_write)
+    logger = RunLogger("bg-fail", root=tmp_path, background_writes=True)
+    logger.log_refusal("a")
+    logger.log_refusal("b")
+    release.set()
+
+    with pytest.raises(OSError, match="disk full"):
+        logger.close()
+    assert logger.tmp_path.exists()
+    assert not logger.path.exists()
+
+
+def test_fixed_shape_events_match_json_dumps(tmp_path: Path) -> None:
+    logger = RunLogger("fixed", root=tmp_path)
+    logger.log_refusal("é\"skill")
+    logger.log_delay("s", float("nan"))
+    logger.log_delay("s", 12.5)
+    logger.log_absurde("s", "--- a\n+++ b\n\t\u2028")
+    logger.close()
+
+    lines = logger.path.read_text(encoding="utf-8").split("\n")[:-1]
+    assert len(lines) == 4
+    for line in lines:
+        assert line == json.dumps(json.loads(line), ensure_ascii=False)
+
+
+def test_writev_all_resumes_after_short_writes(tmp_path: Path, monkeypatch) -> None:
+    import singular.runs.logger as logger_mod
+
+    calls: list[int] = []
+
+    def short_writev(fd, buffers):
+        calls.append(len(buffers))
+        return os.write(fd, b"".join(buffers)[:3])
+
+    monkeypatch.setattr(logger_mod, "_IOV_MAX", 2)
+    path = tmp_path / "log.jsonl"
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+    try:
+        logger_mod._writev_all(fd, [b"{}\n", b'{"a": 1}\n', b"[]\n"], short_writev)
+    finally:
+        os.close(fd)
+
+    assert path.read_bytes() == b'{}\n{"a": 1}\n[]\n'
+    assert max(calls) == 2
+
+
+def test_batches_fall_back_to_joined_writes_without_writev(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import singular.runs.logger as logger_mod
+
+    monkeypatch.setattr(logger_mod, "_writev", None)
+    logger = RunLogger("nowritev", root=tmp_path, batch_size=2)
+    logger.log_refusal("a")
+    logger.log_refusal("b")
+    logger.close()
+
+    lines = logger.path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["skill"] for line in lines] == ["a", "b"]
+
+
+def test_run_logs_are_opened_for_synchronous_writes(tmp_path: Path) -> None:
+    import fcntl
+
+    import singular.runs.logger as logger_mod
+
+    logger = RunLogger("dsync", root=tmp_path)
+    try:
+        for handle in (logger._file, logger._events_file, logger._consciousness_file):
+            flags = fcntl.fcntl(handle.fileno(), fcntl.F_GETFL)
+            assert flags & logger_mod._DSYNC_FLAG == logger_mod._DSYNC_FLAG
+            assert flags & os.O_APPEND
+    finally:
+        logger.close()
+
+
+def test_sync_log_falls_back_to_data_sync_without_dsync(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import singular.runs.logger as logger_mod
+
+    synced: list[int] = []
+    monkeypatch.setattr(logger_mod, "_DSYNC_FLAG", 0)
+    monkeypatch.setattr(logger_mod, "_data_sync", synced.append)
+    monkeypatch.setattr(
+        logger_mod.os, "fsync", lambda _fd: pytest.fail("full fsync used")
+    )
+
+    with (tmp_path / "log.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write("{}\n")
+        logger_mod._sync_log(handle)
+        assert synced == [handle.fileno()]
+
+
+def test_event_line_matches_json_dumps_of_the_envelope(tmp_path: Path) -> None:
+    logger = RunLogger("envelope", root=tmp_path)
+    logger.log_event("custom.ping", detail={"é": [1, 2.5, None]}, ok=True)
+    logger.close()
+
+    record_line = logger.path.read_text(encoding="utf-8").splitlines()[0]
+    event_line = (tmp_path / "envelope" / "events.jsonl").read_text(
+        encoding="utf-8"
+    ).splitlines()[0]
+    record = json.loads(record_line)
+    assert event_line == json.dumps(
+        {
+            "version": 1,
+            "event_type": "custom.ping",
+            "ts": record["ts"],
+            "payload": record,
+        },
+        ensure_ascii=False,
+    )
+
+
+def test_episodes_reuse_the_encoded_record(tmp_path: Path, monkeypatch) -> None:
+    import singular.runs.logger as logger_mod
+
+    episodes: list[tuple[dict, str]] = []
+    monkeypatch.setattr(
+        logger_mod,
+        "add_episode",
+        lambda episode, **kwargs: episodes.append((episode, kwargs["encoded"])),
+    )
+    logger = RunLogger("episodes", root=tmp_path)
+    logger.log("skill", "op", "diff é", True, 1.0, 2.0, 0.2, 0.1)
+    logger.log_refusal("skill")
+    logger.close()
+
+    assert [episode["event"] for episode, _ in episodes] == ["mutation", "refuse"]
+    assert episodes[0][0]["mood"] == "proud"
+    for episode, encoded in episodes:
+        assert encoded == json.dumps(episode, ensure_ascii=False)
+
+
+def test_utc_timestamp_matches_isoformat_and_reuses_second(monkeypatch) -> None:
+    import singular.runs.logger as logger_mod
+
+    monkeypatch.setattr(logger_mod, "_LAST_TIMESTAMP", (-1, ""))
+    monkeypatch.setattr(logger_mod.time, "time", lambda: 1_700_000_000.75)
+
+    stamp = logger_mod._utc_timestamp()
+
+    expected = datetime.fromtimestamp(1_700_000_000, timezone.utc).isoformat(
+        timespec="seconds"
+    )
+    assert stamp == expected
+    assert logger_mod._utc_timestamp() is stamp
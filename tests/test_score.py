@@ -139,3 +139,25 @@ def test_loop_rejects_candidate_mutation_failure_without_global_breaker():
     assert _sandbox_failure_category(
         base.is_candidate_failure, mutation.is_candidate_failure, "result = 'bad'"
     ) == ("invalid_mutation_rejected", "medium", False)
+
+
+def test_complexity_counts_ast_nodes():
+    import ast
+
+    from singular.life.score import complexity
+
+    # Module, Assign, Name, Store, Constant
+    assert complexity(ast.parse("result = 1")) == 5
+
+
+def test_score_uses_given_node_count(monkeypatch):
+    from singular.life import score as score_mod
+
+    monkeypatch.setattr(sandbox, "run", lambda _code: None)
+    monkeypatch.setattr(
+        score_mod.ast, "parse", lambda _code: pytest.fail("code was re-parsed")
+    )
+
+    value, _ = score("result = 1", runs=1, alpha=1000.0, node_count=5)
+
+    assert 5000.0 <= value < 5100.0
@@ -27,7 +27,7 @@ def test_sleep_regenerates_energy_without_mutation(tmp_path, monkeypatch):
     checkpoint = tmp_path / "ckpt.json"
 
     psyche = Psyche(energy=5)
-    psyche.save_state = lambda path=None: None
+    monkeypatch.setattr(Psyche, "save_state", lambda self, path=None: None)
     monkeypatch.setattr(life_loop.Psyche, "load_state", classmethod(lambda cls: psyche))
 
     calls = {"n": 0}
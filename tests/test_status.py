@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 
 import singular.organisms.status as status_mod
 from singular.life.life_status import LifeStatusResult
@@ -310,3 +311,18 @@ def test_status_exposes_skill_lifecycle_counts(tmp_path, monkeypatch, capsys) ->
     assert payload["skills_lifecycle"]["active"] == 1
     assert payload["skills_lifecycle"]["dormant"] == 1
     assert payload["skills_lifecycle"]["archived"] == 1
+
+
+def test_run_files_by_mtime_orders_jsonl_files_and_tolerates_missing_dir(tmp_path):
+    older = tmp_path / "b.jsonl"
+    newer = tmp_path / "a.jsonl"
+    older.write_text("{}\n", encoding="utf-8")
+    newer.write_text("{}\n", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+    os.utime(older, (1, 1))
+    os.utime(newer, (2, 2))
+
+    files = status_mod._run_files_by_mtime(tmp_path)
+
+    assert [entry.name for entry in files] == ["b.jsonl", "a.jsonl"]
+    assert status_mod._run_files_by_mtime(tmp_path / "missing") == []
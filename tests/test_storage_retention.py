@@ -291,3 +291,26 @@ def test_retention_does_not_delete_sqlite_storage(tmp_path) -> None:
     apply_runs_retention(runs_dir=runs_dir, config=config)
 
     assert db.exists()
+
+
+def test_run_retention_service_keeps_most_recent_tmp_logs(
+    tmp_path, monkeypatch
+) -> None:
+    import os
+
+    now = datetime(2026, 4, 15, tzinfo=timezone.utc)
+    runs_dir = tmp_path / "runs"
+    runs_dir.mkdir()
+    for age, name in enumerate(["c", "b", "a"]):
+        tmp = runs_dir / f"{name}-20260101000000.jsonl.tmp"
+        tmp.write_text("{}\n", encoding="utf-8")
+        stamp = (now - timedelta(hours=age)).timestamp()
+        os.utime(tmp, (stamp, stamp))
+    monkeypatch.setenv("SINGULAR_RETENTION_MAX_RUNS", "2")
+
+    run_retention_service(base_dir=tmp_path, runs_dir=runs_dir, now=now)
+
+    assert sorted(path.name for path in runs_dir.glob("*.jsonl.tmp")) == [
+        "b-20260101000000.jsonl.tmp",
+        "c-20260101000000.jsonl.tmp",
+    ]
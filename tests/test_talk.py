@@ -6,7 +6,12 @@ import pytest
 from singular.cli import main
 from singular.lives import load_registry
 from singular.memory import read_causal_timeline, read_episodes
-from singular.organisms.talk import _default_reply, talk
+from singular.organisms.talk import (
+    _EpisodeTail,
+    _default_reply,
+    _scan_recent_episodes,
+    talk,
+)
 from singular.providers import (
     LLMProviderContract,
     LLMProviderClient,
@@ -510,3 +515,73 @@ def test_talk_recalls_prior_episode_in_provider_prompt(monkeypatch, tmp_path):
         "Peux-tu aider avec ce bug urgent"
         in assistant["context"]["recalled_memory_summary"]
     )
+
+
+def test_scan_recent_episodes_collects_latest_entries_in_one_pass():
+    episodes = [
+        {"role": "user", "text": "first"},
+        {"event": "mutation", "improved": True, "op": "old_success"},
+        {"event": "mutation", "improved": False, "op": "failure"},
+        {"role": "user", "text": "second"},
+        {"role": "user", "text": ""},
+        {"event": "mutation", "improved": True, "op": "success"},
+        {"event": "perception"},
+    ]
+
+    last_event, latest, success, failure = _scan_recent_episodes(episodes)
+
+    assert last_event == "second"
+    assert latest is episodes[5]
+    assert success is episodes[5]
+    assert failure is episodes[2]
+    assert _scan_recent_episodes([]) == (None, None, None, None)
+
+
+def test_episode_tail_only_parses_appended_lines(tmp_path):
+    path = tmp_path / "episodic.jsonl"
+    tail = _EpisodeTail(path)
+    assert tail.refresh() == (None, None, None, None)
+
+    path.write_text(
+        '{"role": "user", "text": "hello"}\n'
+        '{"event": "mutation", "improved": false, "op": "slow"}\n',
+        encoding="utf-8",
+    )
+    last_event, latest, success, failure = tail.refresh()
+    assert last_event == "hello"
+    assert latest == failure == {"event": "mutation", "improved": False, "op": "slow"}
+    assert success is None
+    offset = tail.offset
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"event": "mutation", "improved": true, "op": "fast"}\n')
+        handle.write('{"role": "user", "text": "partial"')
+    last_event, latest, success, failure = tail.refresh()
+    assert last_event == "hello"
+    assert latest == success == {"event": "mutation", "improved": True, "op": "fast"}
+    assert failure["op"] == "slow"
+    assert tail.offset > offset
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("}\n")
+    assert tail.refresh()[0] == "partial"
+
+    path.write_text('{"role": "user", "text": "reset"}\n', encoding="utf-8")
+    assert tail.refresh() == ("reset", None, None, None)
+
+
+def test_talk_quit_skips_perception_capture(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SINGULAR_HOME", raising=False)
+    monkeypatch.setattr("singular.organisms.talk.load_llm_client", lambda _name: None)
+    monkeypatch.setattr("builtins.input", lambda _="": "quit")
+    monkeypatch.setattr("builtins.print", lambda _msg: None)
+
+    def fail_capture():
+        raise AssertionError("perception captured before quitting")
+
+    monkeypatch.setattr("singular.organisms.talk.capture_signals", fail_capture)
+
+    talk()
+
+    assert read_episodes() == []